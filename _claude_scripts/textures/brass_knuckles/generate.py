@@ -4,10 +4,15 @@ Brass Knuckles sprite generator for DEEP YELLOW
 Generates a 64x64 PSX-style sprite of brass knuckles (BODY item)
 """
 from PIL import Image, ImageDraw
+from PIL.PngImagePlugin import PngInfo
+import numpy as np
+import argparse
+import os
 import random
 import math
 
 SIZE = 64
+OUTPUT_PATH = 'output.png'
 
 # Brass/gold color palette
 BRASS_DARK = (140, 110, 50)       # Dark brass shadows
@@ -29,6 +34,29 @@ def add_grain(img, intensity=12):
                 b = max(0, min(255, b + noise))
                 pixels[x, y] = (r, g, b, a)
 
+def render_bar(bar_width, bar_height):
+    """Pre-render the main bar (shadow, mid and highlight layers) as one tile.
+
+    The tile's top row sits one pixel above bar_y, where the mid and
+    highlight layers start.
+    """
+    bar = np.zeros((bar_height + 2, bar_width + 1, 4), dtype=np.uint8)
+    bar[1:] = BRASS_DARK + (255,)             # Bottom shadow layer
+    bar[:bar_height] = BRASS_MID + (255,)     # Mid layer
+    bar[:4, 2:bar_width - 1] = BRASS_LIGHT + (255,)  # Top highlight
+    return Image.fromarray(bar, 'RGBA')
+
+def render_rivet():
+    """Pre-render a 5x5 rivet/stud tile and the mask of pixels it covers"""
+    rivet = Image.new('RGBA', (5, 5), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(rivet)
+    # Rivet body
+    draw.ellipse([0, 0, 4, 4], fill=BRASS_DARK + (255,))
+    # Rivet highlight
+    draw.ellipse([1, 0, 3, 1], fill=BRASS_HIGHLIGHT + (220,))
+    mask = rivet.getchannel('A').point(lambda a: 255 if a else 0)
+    return rivet, mask
+
 def draw_finger_hole(draw, center_x, center_y, width, height, fill_color):
     """Draw a rounded rectangular finger hole"""
     # Outer ring
@@ -69,27 +97,10 @@ def draw_brass_knuckles():
     bar_height = 10
     bar_y = center_y + 8
 
-    # Draw main bar with depth
-    # Bottom shadow layer
-    draw.rectangle(
-        [center_x - bar_width//2, bar_y,
-         center_x + bar_width//2, bar_y + bar_height],
-        fill=BRASS_DARK + (255,)
-    )
-
-    # Mid layer
-    draw.rectangle(
-        [center_x - bar_width//2, bar_y - 1,
-         center_x + bar_width//2, bar_y + bar_height - 2],
-        fill=BRASS_MID + (255,)
-    )
-
-    # Top highlight
-    draw.rectangle(
-        [center_x - bar_width//2 + 2, bar_y - 1,
-         center_x + bar_width//2 - 2, bar_y + 2],
-        fill=BRASS_LIGHT + (255,)
-    )
+    # Draw main bar with depth: pre-render the shadow/mid/highlight layers
+    # into one small array and paste it in a single call
+    bar_x = center_x - bar_width//2
+    img.paste(render_bar(bar_width, bar_height), (bar_x, bar_y - 1))
 
     # Draw 4 finger holes
     hole_spacing = 11
@@ -163,17 +174,9 @@ def draw_brass_knuckles():
         (center_x + 18, bar_y + bar_height//2),
     ]
 
+    rivet, rivet_mask = render_rivet()
     for rivet_x, rivet_y in rivet_positions:
-        # Rivet body
-        draw.ellipse(
-            [rivet_x - 2, rivet_y - 2, rivet_x + 2, rivet_y + 2],
-            fill=BRASS_DARK + (255,)
-        )
-        # Rivet highlight
-        draw.ellipse(
-            [rivet_x - 1, rivet_y - 2, rivet_x + 1, rivet_y - 1],
-            fill=BRASS_HIGHLIGHT + (220,)
-        )
+        img.paste(rivet, (rivet_x - 2, rivet_y - 2), rivet_mask)
 
     # Add metallic sheen across top
     draw.rectangle(
@@ -187,16 +190,41 @@ def draw_brass_knuckles():
 
     return img
 
+def is_up_to_date(path, seed):
+    """True if path was generated by this version of the script with the same seed"""
+    if seed is None or not os.path.exists(path):
+        return False
+    if os.path.getmtime(path) < os.path.getmtime(__file__):
+        return False
+    with Image.open(path) as existing:
+        return existing.info.get('seed') == str(seed)
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate the Brass Knuckles sprite")
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed (seeded runs skip regeneration when output.png is current)')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if output.png is current')
+    args = parser.parse_args()
+
+    if not args.force and is_up_to_date(OUTPUT_PATH, args.seed):
+        print(f"✓ {OUTPUT_PATH} is up to date (seed {args.seed}), skipping")
+        return
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
     print("Generating Brass Knuckles sprite (64x64, PSX-style)...")
     print("- Warm brass/gold coloring")
     print("- 4 finger holes visible from above")
     print("- Metallic sheen with grain texture")
 
     img = draw_brass_knuckles()
-    img.save('output.png', 'PNG')
+    pnginfo = PngInfo()
+    if args.seed is not None:
+        pnginfo.add_text('seed', str(args.seed))
+    img.save(OUTPUT_PATH, 'PNG', pnginfo=pnginfo)
 
-    print("✓ Generated: output.png")
+    print(f"✓ Generated: {OUTPUT_PATH}")
     print(f"  Size: {SIZE}x{SIZE} pixels")
     print("  Format: RGBA (transparent background)")
 
@@ -200,15 +200,23 @@ def main():
     print("Loading base ceiling texture...")
     base_img = Image.open(INPUT_PATH)
 
-    # Ensure it's the right size
-    if base_img.size != (SIZE, SIZE):
-        print(f"Resizing base texture from {base_img.size} to {SIZE}x{SIZE}")
-        base_img = base_img.resize((SIZE, SIZE), Image.Resampling.LANCZOS)
-
     # Convert to RGB if needed
     if base_img.mode != 'RGB':
         base_img = base_img.convert('RGB')
 
+    # Ensure it's the right size
+    if base_img.size != (SIZE, SIZE):
+        print(f"Resizing base texture from {base_img.size} to {SIZE}x{SIZE}")
+        width, height = base_img.size
+        if width == height and width > SIZE and width % SIZE == 0:
+            # Integer shrink factor: box-average in NumPy (much faster than
+            # LANCZOS, and the softer result suits the PSX look anyway)
+            k = width // SIZE
+            boxed = np.asarray(base_img, dtype=np.float32).reshape(SIZE, k, SIZE, k, 3).mean(axis=(1, 3))
+            base_img = Image.fromarray(boxed.round().astype(np.uint8))
+        else:
+            base_img = base_img.resize((SIZE, SIZE), Image.Resampling.LANCZOS)
+
     base_array = np.array(base_img)
 
     print("Creating irregular hole mask...")
@@ -267,11 +275,10 @@ def main():
                         result[py, px] = (result[py, px] * random.uniform(0.4, 0.7)).astype(np.uint8)
 
     # Add shadow/darkening around all edges
-    for y in range(SIZE):
-        for x in range(SIZE):
-            if edge_mask[y, x]:
-                # Edges are darker (exposed backing material/shadow)
-                result[y, x] = (result[y, x] * random.uniform(0.5, 0.8)).astype(np.uint8)
+    # Edges are darker (exposed backing material/shadow) - one broadcasted multiply
+    edge_darken = np.random.uniform(0.5, 0.8, (SIZE, SIZE, 1)).astype(np.float32)
+    edge_darken = np.where(edge_mask[:, :, None], edge_darken, np.float32(1.0))
+    result = np.clip(result * edge_darken, 0, 255).astype(np.uint8)
 
     print("Saving output...")
     output_img = Image.fromarray(result)
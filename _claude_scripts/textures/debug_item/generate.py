@@ -3,254 +3,295 @@
 DEBUG_ITEM sprite generator for DEEP YELLOW
 Generates a 64x64 PSX-style sprite of a malfunctioning anomaly containment device
 """
+from collections import defaultdict
+from multiprocessing import Pool
 from PIL import Image, ImageDraw
+import numpy as np
+import argparse
 import random
 import math
 
 SIZE = 64
 
-# Industrial containment device palette
-METAL_DARK = (40, 45, 50)          # Dark gunmetal
-METAL_MID = (60, 65, 70)           # Mid grey metal
-METAL_LIGHT = (90, 95, 100)        # Light metal highlight
-METAL_EDGE = (120, 125, 130)       # Edge highlight
+# Industrial containment device palette (RGBA, ready to write straight into the canvas)
+METAL_DARK = (40, 45, 50, 255)            # Dark gunmetal
+METAL_MID = (60, 65, 70, 255)             # Mid grey metal
+METAL_LIGHT_A200 = (90, 95, 100, 200)     # Light metal highlight (rim bevel)
+METAL_EDGE_A200 = (120, 125, 130, 200)    # Edge highlight (tubes)
 
 # Warning/status lights (malfunctioning)
-WARNING_RED = (220, 40, 30)        # Danger red
-WARNING_ORANGE = (255, 120, 20)    # Alert orange
-HAZARD_YELLOW = (255, 200, 30)     # Caution yellow
+WARNING_RED = (220, 40, 30, 255)          # Danger red
+WARNING_ORANGE = (255, 120, 20, 255)      # Alert orange
+HAZARD_YELLOW = (255, 200, 30, 255)       # Caution yellow
+HAZARD_YELLOW_A220 = (255, 200, 30, 220)  # Damage spark
 
 # Unstable energy containment
-ENERGY_CYAN = (60, 220, 255)       # Unstable cyan energy
-ENERGY_PURPLE = (180, 60, 255)     # Chaotic purple energy
-ENERGY_SPARK = (255, 255, 255)     # White sparks
+ENERGY_CYAN_A200 = (60, 220, 255, 200)    # Unstable cyan energy (glow)
+ENERGY_PURPLE_A200 = (180, 60, 255, 200)  # Chaotic purple energy (glow)
+ENERGY_CYAN_A180 = (60, 220, 255, 180)    # Unstable cyan energy (arcs)
+ENERGY_PURPLE_A180 = (180, 60, 255, 180)  # Chaotic purple energy (arcs)
+ENERGY_SPARK = (255, 255, 255, 255)       # White sparks
 
 # Panel details
-PANEL_DARK = (25, 28, 30)          # Dark panel sections
-VENT_SLOT = (15, 18, 20)           # Vent/slot darkness
-
-def add_grain(img, intensity=12):
-    """Add PSX-style grain/noise to the image"""
-    pixels = img.load()
-    for y in range(SIZE):
-        for x in range(SIZE):
-            r, g, b, a = pixels[x, y]
-            if a > 0:
-                noise = random.randint(-intensity, intensity)
-                r = max(0, min(255, r + noise))
-                g = max(0, min(255, g + noise))
-                b = max(0, min(255, b + noise))
-                pixels[x, y] = (r, g, b, a)
-
-def draw_device():
-    """Generate the malfunctioning containment device sprite"""
-    img = Image.new('RGBA', (SIZE, SIZE), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # Center position
-    center_x = SIZE // 2
-    center_y = SIZE // 2
-
-    # Main device body (cylindrical/rectangular containment unit)
-    device_width = 32
-    device_height = 40
-    device_top = center_y - device_height // 2
-    device_bottom = center_y + device_height // 2
-    device_left = center_x - device_width // 2
-    device_right = center_x + device_width // 2
+PANEL_DARK = (25, 28, 30, 255)            # Dark panel sections
+PANEL_DARK_A180 = (25, 28, 30, 180)       # Rim shadow
+VENT_SLOT = (15, 18, 20, 255)             # Vent/slot darkness
+
+# Sprite layout
+CENTER_X = SIZE // 2
+CENTER_Y = SIZE // 2
+DEVICE_WIDTH = 32                  # Main containment unit body
+DEVICE_HEIGHT = 40
+DEVICE_TOP = CENTER_Y - DEVICE_HEIGHT // 2
+DEVICE_BOTTOM = CENTER_Y + DEVICE_HEIGHT // 2
+DEVICE_LEFT = CENTER_X - DEVICE_WIDTH // 2
+DEVICE_RIGHT = CENTER_X + DEVICE_WIDTH // 2
+PANEL_HEIGHT = DEVICE_HEIGHT // 3
+CORE_Y = CENTER_Y + 2              # Energy core sits just below center
+# Everything drawn lies inside the body plus the 5px side tubes (exclusive bounds)
+SPRITE_BBOX = (DEVICE_LEFT - 5, DEVICE_TOP, DEVICE_RIGHT + 6, DEVICE_BOTTOM + 1)
+
+def rasterize_disk(diameter):
+    """Rasterize a filled disk spanning a (diameter + 1)-pixel bbox as a bool mask"""
+    mask = Image.new('L', (diameter + 1, diameter + 1), 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, diameter, diameter], fill=255)
+    return np.asarray(mask) > 0
+
+def rasterize_polygon(points, width, height):
+    """Rasterize a filled polygon (box-relative points) as a bool mask"""
+    mask = Image.new('L', (width, height), 0)
+    ImageDraw.Draw(mask).polygon(points, fill=255)
+    return np.asarray(mask) > 0
+
+# Energy arc directions: 256 evenly spaced angles, indexed by getrandbits(8)
+ARC_COS = [math.cos(2 * math.pi * i / 256) for i in range(256)]
+ARC_SIN = [math.sin(2 * math.pi * i / 256) for i in range(256)]
+
+# Every disk size the sprite uses, rasterized once at import
+DISKS = {diameter: rasterize_disk(diameter) for diameter in (2, 4, 6, 10, 14)}
+
+# Damaged corner notch, relative to (device_right - 2, device_top)
+DAMAGE_MASK = rasterize_polygon([(0, 2), (2, 0), (2, 4)], 3, 5)
+
+def paste_disk(canvas, color, center_x, center_y, diameter):
+    """Stamp a cached disk mask of the given diameter in a solid color"""
+    x0 = center_x - diameter // 2
+    y0 = center_y - diameter // 2
+    canvas[y0:y0 + diameter + 1, x0:x0 + diameter + 1][DISKS[diameter]] = color
+
+def add_grain(pixels, rng, intensity=12, bbox=None):
+    """Add PSX-style grain/noise in place to an (H, W, 4) uint8 array (opaque pixels only).
+
+    bbox = (left, top, right, bottom), exclusive, limits the pass to the
+    region the sprite actually covers.
+    """
+    if bbox is not None:
+        left, top, right, bottom = bbox
+        pixels = pixels[top:bottom, left:right]
+    # NumPy generator seeded from rng, so one random.Random drives the whole sprite.
+    # All noise comes from a single bulk draw of 16-bit words, mapped onto
+    # [-intensity, intensity] by multiply-shift (no per-sample rejection loop)
+    noise_rng = np.random.default_rng(rng.getrandbits(64))
+    height, width = pixels.shape[:2]
+    words = np.frombuffer(noise_rng.bytes(height * width * 2), dtype=np.uint16).reshape(height, width, 1)
+    noise = ((words.astype(np.int32) * (2 * intensity + 1)) >> 16) - intensity
+    # Saturating add in one int16 working buffer, copied back to opaque pixels only
+    rgb = pixels[..., :3].astype(np.int16)
+    rgb += noise.astype(np.int16)
+    np.clip(rgb, 0, 255, out=rgb)
+    np.copyto(pixels[..., :3], rgb, casting='unsafe', where=pixels[..., 3:4] > 0)
+
+def build_static_layers():
+    """Draw every part of the sprite that doesn't depend on the RNG, once.
+
+    Returns (base, top, energy_mask): base is the body/panels/vents/chamber
+    canvas the random parts are drawn onto, top is an RGBA layer of the rim
+    highlights, damaged corner and tubes that are painted over them, and
+    energy_mask covers the energy glow disk left visible around the core spark.
+    """
+    base = np.zeros((SIZE, SIZE, 4), dtype=np.uint8)
 
     # Draw main body (dark metal rectangle)
-    draw.rectangle(
-        [device_left, device_top, device_right, device_bottom],
-        fill=METAL_DARK + (255,)
-    )
+    base[DEVICE_TOP:DEVICE_BOTTOM + 1, DEVICE_LEFT:DEVICE_RIGHT + 1] = METAL_DARK
 
-    # Add metal panel sections (horizontal divisions)
-    panel_height = device_height // 3
+    # Add metal panel sections (horizontal divisions, 2px thick)
     for i in range(1, 3):
-        y_pos = device_top + i * panel_height
-        draw.line(
-            [(device_left, y_pos), (device_right, y_pos)],
-            fill=PANEL_DARK + (255,), width=2
-        )
+        y_pos = DEVICE_TOP + i * PANEL_HEIGHT
+        base[y_pos:y_pos + 2, DEVICE_LEFT:DEVICE_RIGHT + 1] = PANEL_DARK
 
     # Add vertical panel line (asymmetry = malfunction)
-    vert_line_x = center_x - 6
-    draw.line(
-        [(vert_line_x, device_top), (vert_line_x, device_bottom)],
-        fill=PANEL_DARK + (255,), width=2
-    )
-
-    # Add vent slots (top panel)
-    vent_y_start = device_top + 4
-    for i in range(4):
-        vent_y = vent_y_start + i * 3
-        draw.line(
-            [(device_left + 4, vent_y), (device_right - 4, vent_y)],
-            fill=VENT_SLOT + (255,), width=1
-        )
+    vert_line_x = CENTER_X - 6
+    base[DEVICE_TOP:DEVICE_BOTTOM + 1, vert_line_x:vert_line_x + 2] = PANEL_DARK
 
-    # Central energy containment chamber (glowing unstable core)
-    chamber_size = 14
-    chamber_bbox = [
-        center_x - chamber_size // 2,
-        center_y - chamber_size // 2 + 2,
-        center_x + chamber_size // 2,
-        center_y + chamber_size // 2 + 2
-    ]
+    # Add vent slots (top panel): 4 slots, every 3rd row, in one strided write
+    vent_y_start = DEVICE_TOP + 4
+    base[vent_y_start:vent_y_start + 4 * 3:3, DEVICE_LEFT + 4:DEVICE_RIGHT - 3] = VENT_SLOT
 
+    # Central energy containment chamber (glowing unstable core)
     # Draw chamber outer ring (dark)
-    draw.ellipse(chamber_bbox, fill=PANEL_DARK + (255,))
+    paste_disk(base, PANEL_DARK, CENTER_X, CORE_Y, 14)
 
-    # Unstable energy glow (pulsing colors - cyan/purple mix)
-    energy_size = 10
-    energy_bbox = [
-        center_x - energy_size // 2,
-        center_y - energy_size // 2 + 2,
-        center_x + energy_size // 2,
-        center_y + energy_size // 2 + 2
-    ]
-    # Random energy color (chaotic!)
-    energy_color = random.choice([ENERGY_CYAN, ENERGY_PURPLE])
-    draw.ellipse(energy_bbox, fill=energy_color + (200,))
+    # Unstable energy glow: only its footprint is static, the color is rolled per sprite
+    energy_mask = np.zeros((SIZE, SIZE), dtype=bool)
+    paste_disk(energy_mask, True, CENTER_X, CORE_Y, 10)
 
     # Bright core spark
-    spark_size = 4
-    spark_bbox = [
-        center_x - spark_size // 2,
-        center_y - spark_size // 2 + 2,
-        center_x + spark_size // 2,
-        center_y + spark_size // 2 + 2
-    ]
-    draw.ellipse(spark_bbox, fill=ENERGY_SPARK + (255,))
+    paste_disk(base, ENERGY_SPARK, CENTER_X, CORE_Y, 4)
+    paste_disk(energy_mask, False, CENTER_X, CORE_Y, 4)
 
-    # Add erratic energy arcs emanating from core
-    num_arcs = random.randint(3, 5)
-    for _ in range(num_arcs):
-        arc_angle = random.uniform(0, 2 * math.pi)
-        arc_length = random.randint(8, 16)
-        arc_end_x = center_x + math.cos(arc_angle) * arc_length
-        arc_end_y = center_y + 2 + math.sin(arc_angle) * arc_length
-        arc_color = random.choice([ENERGY_CYAN, ENERGY_PURPLE])
-        draw.line(
-            [(center_x, center_y + 2), (arc_end_x, arc_end_y)],
-            fill=arc_color + (180,), width=1
-        )
-
-    # Warning lights (top section - malfunctioning/flickering)
-    light_positions = [
-        (device_left + 8, device_top + panel_height // 2),
-        (device_right - 8, device_top + panel_height // 2)
-    ]
-
-    for light_x, light_y in light_positions:
-        # Random light state (on/off/different colors = malfunction)
-        if random.random() > 0.3:  # 70% chance of being lit
-            light_color = random.choice([WARNING_RED, WARNING_ORANGE, HAZARD_YELLOW])
-            draw.ellipse(
-                [light_x - 3, light_y - 3, light_x + 3, light_y + 3],
-                fill=light_color + (255,)
-            )
-            # Bright center
-            draw.ellipse(
-                [light_x - 1, light_y - 1, light_x + 1, light_y + 1],
-                fill=ENERGY_SPARK + (255,)
-            )
-
-    # Bottom panel indicator lights (smaller, more of them)
-    bottom_light_y = device_bottom - 6
-    for i in range(5):
-        light_x = device_left + 6 + i * 5
-        if random.random() > 0.4:  # Random on/off
-            indicator_color = random.choice([WARNING_RED, WARNING_ORANGE])
-            draw.rectangle(
-                [light_x, bottom_light_y, light_x + 2, bottom_light_y + 2],
-                fill=indicator_color + (255,)
-            )
+    top = np.zeros((SIZE, SIZE, 4), dtype=np.uint8)
 
     # Metal highlights (edges and bevels)
     # Left edge highlight
-    draw.line(
-        [(device_left, device_top), (device_left, device_bottom)],
-        fill=METAL_LIGHT + (200,), width=1
-    )
+    top[DEVICE_TOP:DEVICE_BOTTOM + 1, DEVICE_LEFT] = METAL_LIGHT_A200
     # Top edge highlight
-    draw.line(
-        [(device_left, device_top), (device_right, device_top)],
-        fill=METAL_LIGHT + (200,), width=1
-    )
+    top[DEVICE_TOP, DEVICE_LEFT:DEVICE_RIGHT + 1] = METAL_LIGHT_A200
 
     # Right edge (darker - shadow)
-    draw.line(
-        [(device_right, device_top), (device_right, device_bottom)],
-        fill=PANEL_DARK + (180,), width=1
-    )
+    top[DEVICE_TOP:DEVICE_BOTTOM + 1, DEVICE_RIGHT] = PANEL_DARK_A180
     # Bottom edge (darker)
-    draw.line(
-        [(device_left, device_bottom), (device_right, device_bottom)],
-        fill=PANEL_DARK + (180,), width=1
-    )
+    top[DEVICE_BOTTOM, DEVICE_LEFT:DEVICE_RIGHT + 1] = PANEL_DARK_A180
 
     # Add some asymmetry - damage/malfunction indicators
     # Damaged corner (top right)
-    damage_points = [
-        (device_right - 2, device_top + 2),
-        (device_right, device_top),
-        (device_right, device_top + 4)
-    ]
-    draw.polygon(damage_points, fill=PANEL_DARK + (255,))
-
-    # Spark from damaged area (random)
-    if random.random() > 0.5:
-        spark_x = device_right - 1
-        spark_y = device_top + 3
-        draw.ellipse(
-            [spark_x - 2, spark_y - 2, spark_x + 2, spark_y + 2],
-            fill=HAZARD_YELLOW + (220,)
-        )
+    top[DEVICE_TOP:DEVICE_TOP + 5, DEVICE_RIGHT - 2:DEVICE_RIGHT + 1][DAMAGE_MASK] = PANEL_DARK
 
     # Containment tubes/pipes (small cylinders on sides)
     # Left tube
     tube_width = 4
     tube_height = 12
-    tube_left_x = device_left - 5
-    tube_y = center_y - tube_height // 2 + 6
-    draw.rectangle(
-        [tube_left_x, tube_y, tube_left_x + tube_width, tube_y + tube_height],
-        fill=METAL_MID + (255,)
-    )
+    tube_left_x = DEVICE_LEFT - 5
+    tube_y = CENTER_Y - tube_height // 2 + 6
+    top[tube_y:tube_y + tube_height + 1, tube_left_x:tube_left_x + tube_width + 1] = METAL_MID
     # Tube highlight
-    draw.line(
-        [(tube_left_x, tube_y), (tube_left_x, tube_y + tube_height)],
-        fill=METAL_EDGE + (200,), width=1
-    )
+    top[tube_y:tube_y + tube_height + 1, tube_left_x] = METAL_EDGE_A200
 
     # Right tube (asymmetrical position)
-    tube_right_x = device_right + 1
-    tube_y2 = center_y - tube_height // 2 - 4
-    draw.rectangle(
-        [tube_right_x, tube_y2, tube_right_x + tube_width, tube_y2 + tube_height],
-        fill=METAL_MID + (255,)
-    )
-    draw.line(
-        [(tube_right_x, tube_y2), (tube_right_x, tube_y2 + tube_height)],
-        fill=METAL_EDGE + (200,), width=1
-    )
+    tube_right_x = DEVICE_RIGHT + 1
+    tube_y2 = CENTER_Y - tube_height // 2 - 4
+    top[tube_y2:tube_y2 + tube_height + 1, tube_right_x:tube_right_x + tube_width + 1] = METAL_MID
+    top[tube_y2:tube_y2 + tube_height + 1, tube_right_x] = METAL_EDGE_A200
+
+    return base, top, energy_mask
+
+BASE, TOP_LAYER, ENERGY_MASK = build_static_layers()
+
+# The top layer flattened to (pixel index, RGBA) pairs, so laying the body
+# rims, damaged corner and tubes over the random parts is one scatter
+TOP_INDEX = np.flatnonzero(TOP_LAYER[..., 3] > 0)
+TOP_PIXELS = TOP_LAYER.reshape(-1, 4)[TOP_INDEX]
+
+def draw_device(rng):
+    """Generate the malfunctioning containment device sprite as a (64, 64, 4) uint8 array"""
+    randint = rng.randint
+    choice = rng.choice
+    rand = rng.random
+    getrandbits = rng.getrandbits
+
+    canvas = BASE.copy()
+
+    # Unstable energy glow (pulsing colors - cyan/purple mix)
+    # Random energy color (chaotic!)
+    canvas[ENERGY_MASK] = choice([ENERGY_CYAN_A200, ENERGY_PURPLE_A200])
+
+    # Add erratic energy arcs emanating from core
+    # (angles come from the ARC_COS/ARC_SIN table)
+    num_arcs = randint(3, 5)
+    for _ in range(num_arcs):
+        angle_index = getrandbits(8)
+        arc_length = randint(8, 16)
+        arc_dx = ARC_COS[angle_index] * arc_length
+        arc_dy = ARC_SIN[angle_index] * arc_length
+        arc_color = choice([ENERGY_CYAN_A180, ENERGY_PURPLE_A180])
+        # DDA: one sample per pixel step along the major axis, scattered in one write
+        t = np.linspace(0.0, 1.0, int(max(abs(arc_dx), abs(arc_dy))) + 2)
+        xs = np.rint(CENTER_X + t * arc_dx).astype(np.intp)
+        ys = np.rint(CORE_Y + t * arc_dy).astype(np.intp)
+        canvas[ys, xs] = arc_color
+
+    # Warning lights (top section - malfunctioning/flickering)
+    light_positions = [
+        (DEVICE_LEFT + 8, DEVICE_TOP + PANEL_HEIGHT // 2),
+        (DEVICE_RIGHT - 8, DEVICE_TOP + PANEL_HEIGHT // 2)
+    ]
+
+    for light_x, light_y in light_positions:
+        # Random light state (on/off/different colors = malfunction)
+        if rand() > 0.3:  # 70% chance of being lit
+            light_color = choice([WARNING_RED, WARNING_ORANGE, HAZARD_YELLOW])
+            paste_disk(canvas, light_color, light_x, light_y, 6)
+            # Bright center
+            paste_disk(canvas, ENERGY_SPARK, light_x, light_y, 2)
+
+    # Bottom panel indicator lights (smaller, more of them)
+    # Collect the lit indicators per colour, then write each colour group at once
+    bottom_light_y = DEVICE_BOTTOM - 6
+    indicator_left = DEVICE_LEFT + 6
+    indicator_groups = defaultdict(list)
+    for i in range(5):
+        if rand() > 0.4:  # Random on/off
+            indicator_color = choice([WARNING_RED, WARNING_ORANGE])
+            indicator_groups[indicator_color].append(i * 5)
+    indicator_strip = canvas[bottom_light_y:bottom_light_y + 3, indicator_left:indicator_left + 4 * 5 + 3]
+    for indicator_color, offsets in indicator_groups.items():
+        mask = np.zeros(indicator_strip.shape[:2], dtype=bool)
+        for offset in offsets:
+            mask[:, offset:offset + 3] = True
+        indicator_strip[mask] = indicator_color
+
+    # Rim highlights, damaged corner and tubes (pre-drawn) go over the random parts
+    canvas.reshape(-1, 4)[TOP_INDEX] = TOP_PIXELS
+
+    # Spark from damaged area (random; never overlaps the tubes)
+    if rand() > 0.5:
+        spark_x = DEVICE_RIGHT - 1
+        spark_y = DEVICE_TOP + 3
+        paste_disk(canvas, HAZARD_YELLOW_A220, spark_x, spark_y, 4)
 
     # Apply PSX-style grain
-    add_grain(img, intensity=14)
+    add_grain(canvas, rng, intensity=14, bbox=SPRITE_BBOX)
 
-    return img
+    return canvas
+
+def save_png(canvas, path):
+    """Save an RGBA canvas as PNG with fast zlib settings.
+
+    A 64x64 sprite barely benefits from deeper compression, and Godot
+    re-encodes it on import anyway.
+    """
+    Image.fromarray(canvas, 'RGBA').save(path, 'PNG', compress_level=1)
+
+def generate_one(seed):
+    """Generate one sprite variant from its own seeded random.Random"""
+    return draw_device(random.Random(seed))
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate the DEBUG_ITEM sprite")
+    parser.add_argument('--seed', type=int, default=None, help='Base random seed (default: random)')
+    parser.add_argument('--variants', type=int, default=1,
+                        help='Number of variants to generate in parallel (output_variant_NN.png)')
+    args = parser.parse_args()
+
+    base_seed = args.seed if args.seed is not None else random.randrange(2**32)
+
     print("Generating DEBUG_ITEM sprite (64x64, PSX-style)...")
     print("- Malfunctioning anomaly containment device")
     print("- Industrial/SCP aesthetic with unstable energy")
 
-    img = draw_device()
-    img.save('output.png', 'PNG')
-
-    print("✓ Generated: output.png")
+    if args.variants <= 1:
+        canvas = generate_one(base_seed)
+        save_png(canvas, 'output.png')
+        print("✓ Generated: output.png")
+    else:
+        # Each variant has its own seed, so the batch is reproducible however
+        # the pool schedules it
+        with Pool() as pool:
+            canvases = pool.map(generate_one, range(base_seed, base_seed + args.variants))
+        for i, canvas in enumerate(canvases):
+            save_png(canvas, f'output_variant_{i:02d}.png')
+        print(f"✓ Generated: {args.variants} variants (output_variant_00.png ...)")
+
+    print(f"  Seed: {base_seed}")
     print(f"  Size: {SIZE}x{SIZE} pixels")
     print("  Format: RGBA (transparent background)")
 
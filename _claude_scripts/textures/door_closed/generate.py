@@ -24,70 +24,110 @@ the surrounding frame uses colors sampled from the existing wallpaper texture.
 
 import numpy as np
 from PIL import Image
-import random
-from math import sqrt, sin, cos, pi
+from math import pi
 
 # Configuration
 WIDTH = 128
 HEIGHT = 256
 OUTPUT_PATH = "output.png"
 TILED_PATH = "output_tiled_2x2.png"
+SEED = 42
 WALLPAPER_PATH = "/home/drew/projects/deep_yellow/assets/levels/level_00/textures/wallpaper_yellow.png"
 
 # Door panel colors (warm brown wood, distinct from yellow wallpaper)
-DOOR_BASE = np.array([135, 105, 72], dtype=np.float64)       # Mid brown wood
-DOOR_DARK = np.array([95, 72, 48], dtype=np.float64)         # Dark wood grain
-DOOR_LIGHT = np.array([165, 135, 95], dtype=np.float64)      # Light wood highlight
+DOOR_BASE = np.array([135, 105, 72], dtype=np.float32)       # Mid brown wood
+DOOR_DARK = np.array([95, 72, 48], dtype=np.float32)         # Dark wood grain
+DOOR_LIGHT = np.array([165, 135, 95], dtype=np.float32)      # Light wood highlight
 
 # Frame/trim colors (darker than wallpaper, lighter than door)
-FRAME_COLOR = np.array([140, 120, 80], dtype=np.float64)     # Muted brownish-gold frame trim
-FRAME_SHADOW = np.array([100, 85, 55], dtype=np.float64)     # Shadow side of frame
+FRAME_COLOR = np.array([140, 120, 80], dtype=np.float32)     # Muted brownish-gold frame trim
+FRAME_SHADOW = np.array([100, 85, 55], dtype=np.float32)     # Shadow side of frame
 
 # Door handle colors (metallic)
-HANDLE_COLOR = np.array([160, 155, 140], dtype=np.float64)   # Brushed metal
-HANDLE_DARK = np.array([90, 85, 75], dtype=np.float64)       # Handle shadow
-HANDLE_HIGHLIGHT = np.array([200, 195, 180], dtype=np.float64)  # Handle shine
+HANDLE_COLOR = np.array([160, 155, 140], dtype=np.float32)   # Brushed metal
+HANDLE_DARK = np.array([90, 85, 75], dtype=np.float32)       # Handle shadow
+HANDLE_HIGHLIGHT = np.array([200, 195, 180], dtype=np.float32)  # Handle shine
 
 # Wallpaper border colors (fallback if texture not found)
-WALLPAPER_BASE = np.array([169, 154, 118], dtype=np.float64)
+WALLPAPER_BASE = np.array([169, 154, 118], dtype=np.float32)
+
+# PSX-style checkerboard dither: +1.5 where (x + y) is even, -1.5 where odd
+DITHER_PATTERN = np.where(np.add.outer(np.arange(HEIGHT), np.arange(WIDTH)) % 2 == 0, 1.5, -1.5).astype(np.float32)
+
+# One full period down the tile, so every sin/cos of it wraps vertically
+Y_PHASE = (2 * pi * np.arange(HEIGHT) / HEIGHT).astype(np.float32)
+
+# Vertical door darkening, strongest at the top/bottom seam
+VERT_DARK_PROFILE = 0.04 * (1.0 + np.cos(Y_PHASE)) * 0.5
+
+# Periodic vertical grime on the wallpaper strips
+FRAME_GRIME_PROFILE = (0.03 * (1.0 + np.sin(Y_PHASE * 4)) * 0.5
+                       + 0.02 * (1.0 + np.sin(Y_PHASE * 10 + 1.7)) * 0.5)
 
 
 def load_wallpaper():
     """
-    Load the wallpaper texture. Returns a numpy array (float64, RGB) or None.
+    Load the wallpaper texture. Returns a numpy array (float32, RGB) or None.
     The wallpaper is already 128x256 and tileable.
     """
     try:
-        img = Image.open(WALLPAPER_PATH)
-        return np.array(img)[:, :, :3].astype(np.float64)
+        with Image.open(WALLPAPER_PATH) as img:
+            return np.asarray(img.convert('RGB')).astype(np.float32)
     except FileNotFoundError:
         print(f"Warning: Wallpaper not found at {WALLPAPER_PATH}, using procedural fallback")
         return None
 
 
-def create_base_wallpaper_frame(wallpaper_arr):
+def create_base_wallpaper_frame(wallpaper_arr, rng):
     """
     Create the base image filled with wallpaper for the frame area.
     Uses modulo wrapping to sample the wallpaper, ensuring seamless tiling.
     The entire image starts as wallpaper, then the door is painted over the center.
     """
-    img = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float64)
-
     if wallpaper_arr is not None:
         wp_h, wp_w = wallpaper_arr.shape[:2]
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                img[y, x] = wallpaper_arr[y % wp_h, x % wp_w]
+        if (wp_h, wp_w) == (HEIGHT, WIDTH):
+            img = wallpaper_arr.astype(np.float32, copy=True)
+        else:
+            ys = np.arange(HEIGHT) % wp_h
+            xs = np.arange(WIDTH) % wp_w
+            img = wallpaper_arr[np.ix_(ys, xs)].astype(np.float32)
     else:
-        # Procedural fallback
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                noise = random.uniform(-10, 10)
-                img[y, x] = WALLPAPER_BASE + noise
+        # Procedural fallback (one noise value per pixel, shared by all channels)
+        img = WALLPAPER_BASE + rng.uniform(-10, 10, (HEIGHT, WIDTH, 1)).astype(np.float32)
 
     return img
 
 
+def build_door_surface(door_left, door_right):
+    """
+    Build the smooth part of the door face in one pass: wood base colour,
+    wrapping grain, vertical darkening toward the tile seam, and grime
+    darkening where the door meets the frame. Returns a float32 array of
+    shape (HEIGHT, door_right - door_left, 3).
+    """
+    # Wood base with wrapping grain (broadcast over a y/x grid)
+    y_phase = Y_PHASE[:, None]
+    x = np.arange(door_left, door_right, dtype=np.float32)[None, :]
+    # Use modulo-friendly grain: sin functions are inherently periodic,
+    # but we need the period to divide HEIGHT evenly for vertical tiling.
+    grain_offset = np.sin(y_phase * 6 + x * 0.02) * 8
+    grain_fine = np.sin(y_phase * 24 + x * 0.05) * 3
+    vert_variation = np.sin(x * 0.1) * 5
+    grain = grain_offset + grain_fine + vert_variation
+
+    # Darken near left and right edges of door (grime at frame junction)
+    edge_zone = 6
+    t = np.arange(edge_zone) / edge_zone
+    edge_dark = np.ones(door_right - door_left, dtype=np.float32)
+    edge_dark[:edge_zone] = 1.0 - (1.0 - t) * 0.18
+    edge_dark[-edge_zone:] = 1.0 - t * 0.18
+
+    # Vertical edge darkening that wraps seamlessly using periodic function
+    scale = (1.0 - VERT_DARK_PROFILE)[:, None] * edge_dark[None, :]
+    return (DOOR_BASE + grain[..., None]) * scale[..., None]
+
+
 def draw_door_panel(img):
     """
     Draw the main door panel in the center of the texture.
@@ -107,49 +147,39 @@ def draw_door_panel(img):
     door_left = frame_width + trim_width
     door_right = WIDTH - frame_width - trim_width
 
-    # Draw the door panel wood base with wrapping grain
-    for y in range(HEIGHT):
-        for x in range(door_left, door_right):
-            # Use modulo-friendly grain: sin functions are inherently periodic,
-            # but we need the period to divide HEIGHT evenly for vertical tiling.
-            grain_offset = sin(2 * pi * y / HEIGHT * 6 + x * 0.02) * 8
-            grain_fine = sin(2 * pi * y / HEIGHT * 24 + x * 0.05) * 3
-            vert_variation = sin(x * 0.1) * 5
-
-            color = DOOR_BASE + grain_offset + grain_fine + vert_variation
-            img[y, x] = color
+    img[:, door_left:door_right] = build_door_surface(door_left, door_right)
 
     return img, door_left, door_right
 
 
-def add_wood_grain(img, door_left, door_right):
+def add_wood_grain(img, door_left, door_right, rng):
     """
     Add subtle horizontal wood grain lines across the door panel.
     These are thin, slightly darker or lighter streaks.
     All grain lines wrap vertically using modulo.
     """
-    num_grain_lines = random.randint(35, 55)
-    for _ in range(num_grain_lines):
-        y_pos = random.randint(0, HEIGHT - 1)
-        thickness = random.randint(1, 2)
-        intensity = random.uniform(0.06, 0.18)
-        is_dark = random.random() < 0.7
-
-        target = DOOR_DARK if is_dark else DOOR_LIGHT
-
-        # Grain line with slight waviness -- wave uses tiling-safe frequency
-        wave_freq = random.uniform(0.02, 0.08)
-        wave_amp = random.uniform(0, 2)
-
-        for dy in range(thickness):
-            for x in range(door_left, door_right):
-                y = (y_pos + dy + int(sin(x * wave_freq) * wave_amp)) % HEIGHT
-                img[y, x] = img[y, x] * (1 - intensity) + target * intensity
+    num_grain_lines = rng.integers(35, 56)
+    y_pos = rng.integers(0, HEIGHT, num_grain_lines)
+    thickness = rng.integers(1, 3, num_grain_lines)
+    intensity = rng.uniform(0.06, 0.18, num_grain_lines)
+    is_dark = rng.random(num_grain_lines) < 0.7
+    # Grain line with slight waviness -- wave uses tiling-safe frequency
+    wave_freq = rng.uniform(0.02, 0.08, num_grain_lines)
+    wave_amp = rng.uniform(0, 2, num_grain_lines)
+
+    # One column per x, so each thickness pass touches every pixel at most once
+    xs = np.arange(door_left, door_right)
+    for i in range(num_grain_lines):
+        target = DOOR_DARK if is_dark[i] else DOOR_LIGHT
+        wave = (np.sin(xs * wave_freq[i]) * wave_amp[i]).astype(np.int64)
+        for dy in range(thickness[i]):
+            ys = (y_pos[i] + dy + wave) % HEIGHT
+            img[ys, xs] += (target - img[ys, xs]) * intensity[i]
 
     return img
 
 
-def draw_frame_trim(img, door_left, door_right):
+def draw_frame_trim(img, door_left, door_right, rng):
     """
     Draw the raised frame trim between the wallpaper and the door panel.
     Creates a 3D beveled look. The trim runs the full height and is
@@ -159,32 +189,24 @@ def draw_frame_trim(img, door_left, door_right):
     frame_width_px = 8
     trim_width_px = 3
 
+    t = (np.arange(trim_width_px) / trim_width_px)[:, None]
+
     # Left trim (light on outer edge, dark on inner edge = raised bevel)
-    for y in range(HEIGHT):
-        for i in range(trim_width_px):
-            x = frame_width_px + i
-            t = i / trim_width_px
-            color = FRAME_COLOR * (1 - t) + FRAME_SHADOW * t
-            noise = random.uniform(-5, 5)
-            img[y, x] = color + noise
+    # Noise is one value per pixel, shared by all channels
+    x = frame_width_px
+    colors = FRAME_COLOR * (1 - t) + FRAME_SHADOW * t
+    img[:, x:x + trim_width_px] = colors[None, :, :] + rng.uniform(-5, 5, (HEIGHT, trim_width_px, 1))
 
     # Right trim (dark on inner edge, light on outer edge)
-    for y in range(HEIGHT):
-        for i in range(trim_width_px):
-            x = WIDTH - frame_width_px - trim_width_px + i
-            t = i / trim_width_px
-            color = FRAME_SHADOW * (1 - t) + FRAME_COLOR * t
-            noise = random.uniform(-5, 5)
-            img[y, x] = color + noise
+    x = WIDTH - frame_width_px - trim_width_px
+    colors = FRAME_SHADOW * (1 - t) + FRAME_COLOR * t
+    img[:, x:x + trim_width_px] = colors[None, :, :] + rng.uniform(-5, 5, (HEIGHT, trim_width_px, 1))
 
     # Thin dark line at junction between trim and wallpaper (shadow gap)
-    for y in range(HEIGHT):
-        # Left shadow gap (between wallpaper and left trim)
-        x_left = frame_width_px
-        img[y, x_left] = img[y, x_left] * 0.7
-        # Right shadow gap (between right trim and wallpaper)
-        x_right = WIDTH - frame_width_px - 1
-        img[y, x_right] = img[y, x_right] * 0.7
+    # Left shadow gap (between wallpaper and left trim)
+    img[:, frame_width_px] *= 0.7
+    # Right shadow gap (between right trim and wallpaper)
+    img[:, WIDTH - frame_width_px - 1] *= 0.7
 
     return img
 
@@ -217,29 +239,19 @@ def draw_recessed_panels(img, door_left, door_right):
 
     for (ptop, pbottom, pleft, pright) in panels:
         # Darken the recessed panel area slightly
-        for y in range(ptop, pbottom):
-            for x in range(pleft, pright):
-                img[y, x] = img[y, x] * 0.92
+        img[ptop:pbottom, pleft:pright] *= 0.92
 
         # Top bevel (shadow - panel is recessed)
-        for y in range(ptop, ptop + bevel):
-            for x in range(pleft, pright):
-                img[y, x] = img[y, x] * 0.78
+        img[ptop:ptop + bevel, pleft:pright] *= 0.78
 
         # Bottom bevel (highlight)
-        for y in range(pbottom - bevel, pbottom):
-            for x in range(pleft, pright):
-                img[y, x] = img[y, x] * 1.08
+        img[pbottom - bevel:pbottom, pleft:pright] *= 1.08
 
         # Left bevel (shadow)
-        for y in range(ptop, pbottom):
-            for x in range(pleft, pleft + bevel):
-                img[y, x] = img[y, x] * 0.80
+        img[ptop:pbottom, pleft:pleft + bevel] *= 0.80
 
         # Right bevel (highlight)
-        for y in range(ptop, pbottom):
-            for x in range(pright - bevel, pright):
-                img[y, x] = img[y, x] * 1.06
+        img[ptop:pbottom, pright - bevel:pright] *= 1.06
 
     return img
 
@@ -261,26 +273,22 @@ def draw_door_handle(img, door_left, door_right):
     bp_top = handle_center_y - bp_height // 2
     bp_bottom = handle_center_y + bp_height // 2
 
-    for y in range(bp_top, bp_bottom):
-        for x in range(bp_left, bp_right):
-            # Rounded corners: skip corner pixels
-            dy = min(y - bp_top, bp_bottom - 1 - y)
-            dx = min(x - bp_left, bp_right - 1 - x)
-            if dy == 0 and dx == 0:
-                continue  # Skip exact corners for rounded look
-            # Metallic gradient on backplate
-            t = (y - bp_top) / max(1, bp_height - 1)
-            base = HANDLE_DARK * 0.9
-            sheen = base * (1.0 + 0.15 * sin(t * pi))
-            img[y, x] = sheen
+    backplate = img[bp_top:bp_bottom, bp_left:bp_right]
+    # Rounded corners: keep the exact corner pixels for rounded look
+    corner_ys = [0, 0, -1, -1]
+    corner_xs = [0, -1, 0, -1]
+    corners = backplate[corner_ys, corner_xs].copy()
+    # Metallic gradient on backplate (varies with y only)
+    t = np.arange(bp_height)[:, None] / max(1, bp_height - 1)
+    base = HANDLE_DARK * 0.9
+    backplate[:] = (base * (1.0 + 0.15 * np.sin(t * pi)))[:, None, :]
+    backplate[corner_ys, corner_xs] = corners
 
     # Backplate edge highlight (top)
-    for x in range(bp_left + 1, bp_right - 1):
-        img[bp_top, x] = HANDLE_COLOR * 0.85
+    img[bp_top, bp_left + 1:bp_right - 1] = HANDLE_COLOR * 0.85
 
     # Backplate edge shadow (bottom)
-    for x in range(bp_left + 1, bp_right - 1):
-        img[bp_bottom - 1, x] = HANDLE_DARK * 0.7
+    img[bp_bottom - 1, bp_left + 1:bp_right - 1] = HANDLE_DARK * 0.7
 
     # --- Lever handle (horizontal bar, slightly larger) ---
     lever_width = 18
@@ -290,204 +298,179 @@ def draw_door_handle(img, door_left, door_right):
     lever_top = handle_center_y - lever_height // 2
     lever_bottom = handle_center_y + lever_height // 2
 
-    for y in range(lever_top, lever_bottom):
-        for x in range(lever_left, lever_right):
-            # Metallic gradient: bright top, darker bottom
-            t = (y - lever_top) / max(1, lever_height - 1)
-            color = HANDLE_HIGHLIGHT * (1 - t * 0.5) + HANDLE_COLOR * (t * 0.5)
-            # Slight horizontal gradient too (brighter toward tip)
-            tx = (x - lever_left) / max(1, lever_width - 1)
-            color = color * (0.9 + tx * 0.15)
-            img[y, x] = color
+    # Metallic gradient: bright top, darker bottom
+    t = np.arange(lever_bottom - lever_top)[:, None] / max(1, lever_height - 1)
+    color = HANDLE_HIGHLIGHT * (1 - t * 0.5) + HANDLE_COLOR * (t * 0.5)
+    # Slight horizontal gradient too (brighter toward tip)
+    tx = np.arange(lever_right - lever_left) / max(1, lever_width - 1)
+    img[lever_top:lever_bottom, lever_left:lever_right] = color[:, None, :] * (0.9 + tx * 0.15)[None, :, None]
 
     # Lever top highlight line
-    for x in range(lever_left, lever_right):
-        img[lever_top, x] = HANDLE_HIGHLIGHT * 1.05
+    img[lever_top, lever_left:lever_right] = HANDLE_HIGHLIGHT * 1.05
 
     # Lever bottom shadow line
-    for x in range(lever_left + 1, lever_right - 1):
-        img[lever_bottom, x] = HANDLE_DARK * 0.85
+    img[lever_bottom, lever_left + 1:lever_right - 1] = HANDLE_DARK * 0.85
 
     # Shadow cast below lever (soft)
     for dy in range(1, 3):
-        for x in range(lever_left + 1, lever_right):
-            yy = lever_bottom + dy
-            shadow_strength = 0.88 + dy * 0.04
-            img[yy, x] = img[yy, x] * shadow_strength
+        shadow_strength = 0.88 + dy * 0.04
+        img[lever_bottom + dy, lever_left + 1:lever_right] *= shadow_strength
 
     # --- Lever return/base (round nub where lever meets backplate) ---
     nub_cx = handle_center_x
     nub_cy = handle_center_y
     nub_r = 3
-    for dy in range(-nub_r, nub_r + 1):
-        for dx in range(-nub_r, nub_r + 1):
-            if dx * dx + dy * dy <= nub_r * nub_r:
-                yy = nub_cy + dy
-                xx = nub_cx + dx
-                dist = sqrt(dx * dx + dy * dy) / nub_r
-                # Bright center, dark edges = convex metallic nub
-                color = HANDLE_HIGHLIGHT * (1 - dist * 0.5) + HANDLE_COLOR * (dist * 0.5)
-                img[yy, xx] = color
+    dy, dx = np.ogrid[-nub_r:nub_r + 1, -nub_r:nub_r + 1]
+    nub_mask = dx * dx + dy * dy <= nub_r * nub_r
+    dist = (np.sqrt(dx * dx + dy * dy) / nub_r)[nub_mask][:, None]
+    # Bright center, dark edges = convex metallic nub
+    nub = img[nub_cy - nub_r:nub_cy + nub_r + 1, nub_cx - nub_r:nub_cx + nub_r + 1]
+    nub[nub_mask] = HANDLE_HIGHLIGHT * (1 - dist * 0.5) + HANDLE_COLOR * (dist * 0.5)
 
     # --- Keyhole: small dark circle below handle ---
     kh_y = handle_center_y + 14
     kh_x = handle_center_x
-    for dy in range(-2, 3):
-        for dx in range(-1, 2):
-            if abs(dy) + abs(dx) <= 2:
-                yy = kh_y + dy
-                xx = kh_x + dx
-                img[yy, xx] = np.array([35, 30, 25], dtype=np.float64)
+    dy, dx = np.ogrid[-2:3, -1:2]
+    keyhole = img[kh_y - 2:kh_y + 3, kh_x - 1:kh_x + 2]
+    keyhole[np.abs(dy) + np.abs(dx) <= 2] = np.array([35, 30, 25], dtype=np.float32)
     # Keyhole highlight (small bright pixel at top)
     img[kh_y - 2, kh_x] = HANDLE_COLOR * 0.6
 
     return img
 
 
-def add_water_stains(img, door_left, door_right):
+def radial_blob(cx, cy, radius, door_left, door_right):
+    """
+    Distance field for a circular blob that wraps around the tile edges.
+    Returns (index, dist, on_door): index selects the blob's bounding box
+    (img[index]), dist is each pixel's distance from the center, and on_door
+    masks the pixels within the radius that fall on the door panel.
+    Blobs are narrower than the tile, so the wrapped indices never repeat.
+    """
+    dy, dx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    dist = np.sqrt(dx * dx + dy * dy)
+    ys = (cy + np.arange(-radius, radius + 1)) % HEIGHT
+    xs = (cx + np.arange(-radius, radius + 1)) % WIDTH
+    door_cols = (xs >= door_left) & (xs < door_right)
+    return np.ix_(ys, xs), dist, (dist <= radius) & door_cols[None, :]
+
+
+def add_water_stains(img, door_left, door_right, rng):
     """
     Add water stain / discoloration patches to the door surface.
     These are irregular darker or yellowish patches that look like
     decades of moisture damage in the Backrooms' humid environment.
     All coordinates use modulo wrapping for seamless tiling.
     """
-    num_stains = random.randint(10, 16)
-    for _ in range(num_stains):
-        # Random center on the door surface
-        cx = random.randint(door_left + 5, door_right - 5)
-        cy = random.randint(0, HEIGHT - 1)
-        radius = random.randint(6, 22)
-        # Stain color shift: slightly yellowed/darkened
-        stain_type = random.choice(["dark", "yellow", "brown"])
-
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                dist = sqrt(dx * dx + dy * dy)
-                if dist > radius:
-                    continue
-                # Falloff: stronger at center, fading at edges
-                falloff = 1.0 - (dist / radius)
-                falloff = falloff * falloff  # Quadratic falloff for softer edges
-                strength = falloff * random.uniform(0.08, 0.18)
-
-                yy = (cy + dy) % HEIGHT
-                xx = (cx + dx) % WIDTH
-
-                # Only apply to door area
-                if xx < door_left or xx >= door_right:
-                    continue
-
-                if stain_type == "dark":
-                    img[yy, xx] = img[yy, xx] * (1.0 - strength * 0.4)
-                elif stain_type == "yellow":
-                    # Shift toward yellow
-                    shift = np.array([5, 3, -8], dtype=np.float64) * strength
-                    img[yy, xx] = img[yy, xx] + shift
-                else:  # brown
-                    # Shift toward darker brown
-                    shift = np.array([-8, -5, -3], dtype=np.float64) * strength
-                    img[yy, xx] = img[yy, xx] + shift
+    num_stains = rng.integers(10, 17)
+    # Random centers on the door surface
+    cxs = rng.integers(door_left + 5, door_right - 4, num_stains)
+    cys = rng.integers(0, HEIGHT, num_stains)
+    radii = rng.integers(6, 23, num_stains)
+    # Stain color shift: slightly yellowed/darkened
+    stain_types = rng.choice(["dark", "yellow", "brown"], num_stains)
+
+    for cx, cy, radius, stain_type in zip(cxs, cys, radii, stain_types):
+        index, dist, on_door = radial_blob(cx, cy, radius, door_left, door_right)
+        # Falloff: stronger at center, fading at edges
+        falloff = 1.0 - (dist[on_door] / radius)
+        falloff = falloff * falloff  # Quadratic falloff for softer edges
+        jitter = rng.uniform(0.08, 0.18, falloff.shape)
+        strength = (falloff * jitter)[:, None]
+
+        region = img[index]
+        if stain_type == "dark":
+            region[on_door] *= 1.0 - strength * 0.4
+        elif stain_type == "yellow":
+            # Shift toward yellow
+            shift = np.array([5, 3, -8], dtype=np.float32) * strength
+            region[on_door] += shift
+        else:  # brown
+            # Shift toward darker brown
+            shift = np.array([-8, -5, -3], dtype=np.float32) * strength
+            region[on_door] += shift
+        img[index] = region
 
     return img
 
 
-def add_edge_darkening(img, door_left, door_right):
+def apply_strokes(img, strokes, door_left, door_right):
     """
-    Add darkening near the frame edges (where grime accumulates where
-    the door meets the frame). Uses smooth gradients that wrap seamlessly.
+    Scale the pixels under a batch of straight strokes in one pass.
+    strokes is an (x, y, length, width, angle, factor) tuple of arrays; each
+    stroke steps along its angle for `length` pixels and is `width` pixels
+    thick downward. Pixels are visited in the same stroke/step/width order as
+    drawing the strokes one by one, and np.multiply.at applies the factor once
+    per visit, so overlapping strokes compound exactly as before.
     """
-    # Darken near left and right edges of door (grime at frame junction)
-    edge_zone = 6
-    for y in range(HEIGHT):
-        for x in range(door_left, door_left + edge_zone):
-            t = 1.0 - ((x - door_left) / edge_zone)
-            img[y, x] = img[y, x] * (1.0 - t * 0.18)
-        for x in range(door_right - edge_zone, door_right):
-            t = (x - (door_right - edge_zone)) / edge_zone
-            img[y, x] = img[y, x] * (1.0 - t * 0.18)
+    sx, sy, lengths, widths, angles, factors = (np.asarray(col) for col in strokes)
+    samples = lengths * widths
+    stroke = np.repeat(np.arange(len(sx)), samples)
+    k = np.arange(samples.sum()) - np.repeat(np.cumsum(samples) - samples, samples)
+    i = k // widths[stroke]
+    w = k % widths[stroke]
 
-    # Vertical edge darkening that wraps seamlessly using periodic function
-    for y in range(HEIGHT):
-        for x in range(door_left, door_right):
-            vert_dark = 0.04 * (1.0 + cos(2 * pi * y / HEIGHT)) * 0.5
-            img[y, x] = img[y, x] * (1.0 - vert_dark)
-
-    return img
+    px = (sx[stroke] + (i * np.cos(angles)[stroke]).astype(np.int64)) % WIDTH
+    py = (sy[stroke] + (i * np.sin(angles)[stroke]).astype(np.int64) + w) % HEIGHT
+    on_door = (px >= door_left) & (px < door_right)
+    np.multiply.at(img, (py[on_door], px[on_door]), factors[stroke][on_door][:, None])
 
 
-def add_scuff_marks(img, door_left, door_right):
+def add_scuff_marks(img, door_left, door_right, rng):
     """
     Add visible scuff marks, scratches, and wear marks across the door.
     More numerous for the taller texture.
     """
     # --- Larger scuff patches (shoe marks, bumps) ---
-    num_scuffs = random.randint(30, 50)
-    for _ in range(num_scuffs):
-        sx = random.randint(door_left + 3, door_right - 3)
-        sy = random.randint(0, HEIGHT - 1)
-        scuff_len = random.randint(3, 12)
-        scuff_width = random.randint(1, 3)
-        angle = random.uniform(-0.5, 0.5)
-        darken = random.uniform(0.80, 0.93)
-
-        for i in range(scuff_len):
-            for w in range(scuff_width):
-                px = (sx + int(i * cos(angle))) % WIDTH
-                py = (sy + int(i * sin(angle)) + w) % HEIGHT
-                if door_left <= px < door_right:
-                    img[py, px] = img[py, px] * darken
+    num_scuffs = rng.integers(30, 51)
+    scuffs = (
+        rng.integers(door_left + 3, door_right - 2, num_scuffs),  # x
+        rng.integers(0, HEIGHT, num_scuffs),                      # y
+        rng.integers(3, 13, num_scuffs),                          # length
+        rng.integers(1, 4, num_scuffs),                           # width
+        rng.uniform(-0.5, 0.5, num_scuffs),                       # angle
+        rng.uniform(0.80, 0.93, num_scuffs),                      # darken
+    )
+    apply_strokes(img, scuffs, door_left, door_right)
 
     # --- Fine scratches (thin single-pixel lines) ---
-    num_scratches = random.randint(12, 22)
-    for _ in range(num_scratches):
-        sx = random.randint(door_left + 5, door_right - 5)
-        sy = random.randint(0, HEIGHT - 1)
-        length = random.randint(5, 25)
-        angle = random.uniform(-pi / 6, pi / 6)
+    num_scratches = rng.integers(12, 23)
+    scratches = (
+        rng.integers(door_left + 5, door_right - 4, num_scratches),
+        rng.integers(0, HEIGHT, num_scratches),
+        rng.integers(5, 26, num_scratches),
+        np.ones(num_scratches, dtype=np.int64),
+        rng.uniform(-pi / 6, pi / 6, num_scratches),
         # Scratches are slightly lighter (exposed wood underneath)
-        lighten = random.uniform(1.04, 1.12)
-
-        for i in range(length):
-            px = (sx + int(i * cos(angle))) % WIDTH
-            py = (sy + int(i * sin(angle))) % HEIGHT
-            if door_left <= px < door_right:
-                img[py, px] = img[py, px] * lighten
+        rng.uniform(1.04, 1.12, num_scratches),
+    )
+    apply_strokes(img, scratches, door_left, door_right)
 
     return img
 
 
-def add_discoloration_patches(img, door_left, door_right):
+def add_discoloration_patches(img, door_left, door_right, rng):
     """
     Add large, subtle discoloration patches across the door surface.
     These simulate decades of uneven aging, UV exposure, and moisture.
     Uses very large, soft blobs for organic-looking wear.
     """
-    num_patches = random.randint(6, 10)
-    for _ in range(num_patches):
-        cx = random.randint(door_left, door_right)
-        cy = random.randint(0, HEIGHT - 1)
-        radius = random.randint(15, 45)
-        # Random color shift
-        r_shift = random.uniform(-12, 8)
-        g_shift = random.uniform(-10, 6)
-        b_shift = random.uniform(-15, 4)
-        shift = np.array([r_shift, g_shift, b_shift], dtype=np.float64)
-
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                dist = sqrt(dx * dx + dy * dy)
-                if dist > radius:
-                    continue
-                falloff = 1.0 - (dist / radius)
-                falloff = falloff * falloff * falloff  # Cubic for very soft edges
-                strength = falloff * 0.5
-
-                yy = (cy + dy) % HEIGHT
-                xx = (cx + dx) % WIDTH
-                if xx < door_left or xx >= door_right:
-                    continue
-
-                img[yy, xx] = img[yy, xx] + shift * strength
+    num_patches = rng.integers(6, 11)
+    cxs = rng.integers(door_left, door_right + 1, num_patches)
+    cys = rng.integers(0, HEIGHT, num_patches)
+    radii = rng.integers(15, 46, num_patches)
+    # Random color shift per patch (R, G, B)
+    shifts = rng.uniform([-12, -10, -15], [8, 6, 4], (num_patches, 3))
+
+    for cx, cy, radius, shift in zip(cxs, cys, radii, shifts):
+        index, dist, on_door = radial_blob(cx, cy, radius, door_left, door_right)
+        falloff = 1.0 - (dist[on_door] / radius)
+        falloff = falloff * falloff * falloff  # Cubic for very soft edges
+        strength = (falloff * 0.5)[:, None]
+
+        region = img[index]
+        region[on_door] += shift * strength
+        img[index] = region
 
     return img
 
@@ -501,38 +484,28 @@ def add_grime_near_handle(img, door_left, door_right):
     handle_cy = HEIGHT // 2
     grime_radius = 20
 
-    for dy in range(-grime_radius, grime_radius + 1):
-        for dx in range(-grime_radius, grime_radius + 1):
-            dist = sqrt(dx * dx + dy * dy)
-            if dist > grime_radius:
-                continue
-            falloff = 1.0 - (dist / grime_radius)
-            falloff = falloff * falloff
-            darken = 1.0 - falloff * 0.12
-
-            yy = (handle_cy + dy) % HEIGHT
-            xx = (handle_cx + dx) % WIDTH
-            if xx < door_left or xx >= door_right:
-                continue
-            img[yy, xx] = img[yy, xx] * darken
+    index, dist, on_door = radial_blob(handle_cx, handle_cy, grime_radius, door_left, door_right)
+    falloff = 1.0 - (dist[on_door] / grime_radius)
+    falloff = falloff * falloff
+    darken = (1.0 - falloff * 0.12)[:, None]
+
+    region = img[index]
+    region[on_door] *= darken
+    img[index] = region
 
     return img
 
 
-def add_overall_noise(img):
+def add_overall_noise(img, rng):
     """
     Add fine pixel-level noise across the entire texture for PSX grittiness.
     """
-    noise = np.random.randn(HEIGHT, WIDTH, 3) * 4.5
+    noise = rng.standard_normal((HEIGHT, WIDTH, 3), dtype=np.float32)
+    noise *= 4.5
     img += noise
 
     # Subtle dithering pattern (PSX-like)
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            if (x + y) % 2 == 0:
-                img[y, x] += 1.5
-            else:
-                img[y, x] -= 1.5
+    img += DITHER_PATTERN[:, :, None]
 
     return img
 
@@ -544,27 +517,25 @@ def add_wallpaper_frame_grime(img, door_left):
     """
     frame_width = 8  # Wallpaper border on each side
 
-    for y in range(HEIGHT):
-        # Periodic vertical grime on wallpaper strips
-        grime = 0.03 * (1.0 + sin(2 * pi * y / HEIGHT * 4)) * 0.5
-        grime += 0.02 * (1.0 + sin(2 * pi * y / HEIGHT * 10 + 1.7)) * 0.5
+    # Periodic vertical grime on wallpaper strips (a 1D profile down the tile)
+    scale = (1.0 - FRAME_GRIME_PROFILE)[:, None, None]
 
-        # Left wallpaper strip
-        for x in range(0, frame_width):
-            img[y, x] = img[y, x] * (1.0 - grime)
+    # Left wallpaper strip
+    img[:, :frame_width] *= scale
 
-        # Right wallpaper strip
-        for x in range(WIDTH - frame_width, WIDTH):
-            img[y, x] = img[y, x] * (1.0 - grime)
+    # Right wallpaper strip
+    img[:, WIDTH - frame_width:] *= scale
 
     return img
 
 
-def generate_door_texture():
+def generate_door_texture(seed=SEED):
     """
     Generate the complete closed door texture with all fixes applied.
+    A single NumPy Generator drives every random draw.
     """
     print("Generating Backrooms closed door texture (iteration 2)...")
+    rng = np.random.default_rng(seed)
 
     # Load wallpaper for frame reference
     print("  Loading wallpaper texture...")
@@ -572,19 +543,19 @@ def generate_door_texture():
 
     # Step 1: Create base with wallpaper frame
     print("  Creating wallpaper frame base...")
-    img = create_base_wallpaper_frame(wallpaper)
+    img = create_base_wallpaper_frame(wallpaper, rng)
 
-    # Step 2: Draw door panel (wood) with tiling-safe grain
+    # Step 2: Draw door panel (wood) with tiling-safe grain and edge darkening
     print("  Drawing door panel...")
     img, door_left, door_right = draw_door_panel(img)
 
     # Step 3: Add wood grain detail (wraps vertically)
     print("  Adding wood grain...")
-    img = add_wood_grain(img, door_left, door_right)
+    img = add_wood_grain(img, door_left, door_right, rng)
 
     # Step 4: Draw frame trim between wallpaper and door
     print("  Drawing frame trim...")
-    img = draw_frame_trim(img, door_left, door_right)
+    img = draw_frame_trim(img, door_left, door_right, rng)
 
     # Step 5: Draw recessed panels on door face
     print("  Drawing recessed panels...")
@@ -596,35 +567,31 @@ def generate_door_texture():
 
     # Step 7: Weathering — water stains
     print("  Adding water stains...")
-    img = add_water_stains(img, door_left, door_right)
+    img = add_water_stains(img, door_left, door_right, rng)
 
-    # Step 8: Weathering — edge darkening (tiling-safe)
-    print("  Adding edge darkening...")
-    img = add_edge_darkening(img, door_left, door_right)
-
-    # Step 9: Weathering — scuff marks and scratches
+    # Step 8: Weathering — scuff marks and scratches
     print("  Adding scuff marks and scratches...")
-    img = add_scuff_marks(img, door_left, door_right)
+    img = add_scuff_marks(img, door_left, door_right, rng)
 
-    # Step 10: Weathering — discoloration patches
+    # Step 9: Weathering — discoloration patches
     print("  Adding discoloration patches...")
-    img = add_discoloration_patches(img, door_left, door_right)
+    img = add_discoloration_patches(img, door_left, door_right, rng)
 
-    # Step 11: Weathering — grime near handle
+    # Step 10: Weathering — grime near handle
     print("  Adding grime near handle...")
     img = add_grime_near_handle(img, door_left, door_right)
 
-    # Step 12: Grime on wallpaper frame strips
+    # Step 11: Grime on wallpaper frame strips
     print("  Adding wallpaper frame grime...")
     img = add_wallpaper_frame_grime(img, door_left)
 
-    # Step 13: Overall PSX noise
+    # Step 12: Overall PSX noise
     print("  Adding PSX noise...")
-    img = add_overall_noise(img)
+    img = add_overall_noise(img, rng)
 
     # Clamp to valid range
     print("  Clamping values...")
-    img = np.clip(img, 0, 255).astype(np.uint8)
+    img = np.clip(img, 0, 255, out=img).astype(np.uint8)
 
     # Convert to PIL Image and save
     result = Image.fromarray(img, mode='RGB')
@@ -639,14 +606,10 @@ def generate_tiled_preview(img_path):
     """
     Create a 2x2 tiled version to visually verify seamlessness.
     """
-    img = Image.open(img_path)
-    width, height = img.size
+    with Image.open(img_path) as img:
+        arr = np.asarray(img.convert('RGB'))
 
-    tiled = Image.new('RGB', (width * 2, height * 2))
-    tiled.paste(img, (0, 0))
-    tiled.paste(img, (width, 0))
-    tiled.paste(img, (0, height))
-    tiled.paste(img, (width, height))
+    tiled = Image.fromarray(np.tile(arr, (2, 2, 1)), mode='RGB')
 
     tiled.save(TILED_PATH)
     print(f"  Saved 2x2 tiled version to {TILED_PATH} for seam verification")
@@ -655,10 +618,6 @@ def generate_tiled_preview(img_path):
 
 
 if __name__ == "__main__":
-    # Fixed seed for reproducibility
-    np.random.seed(42)
-    random.seed(42)
-
     generate_door_texture()
 
     # Verify output
@@ -21,46 +21,61 @@ into normal carpet for seamless vertical tiling too.
 
 import numpy as np
 from PIL import Image
-import random
-from math import sqrt, sin, cos, pi
+from functools import lru_cache
+from math import pi
 
 # Configuration
 SIZE = 128
 OUTPUT_PATH = "output.png"
 TILED_PATH = "output_tiled_2x2.png"
+SEED = 42
 CARPET_PATH = "/home/drew/projects/deep_yellow/assets/levels/level_00/textures/carpet_brown.png"
 
 # Door track colors (brushed aluminum / chrome strip)
-TRACK_BASE = np.array([145, 140, 130], dtype=np.float64)      # Brushed metal base
-TRACK_HIGHLIGHT = np.array([175, 170, 158], dtype=np.float64)  # Metal highlight
-TRACK_SHADOW = np.array([95, 90, 82], dtype=np.float64)        # Metal shadow
-TRACK_GROOVE = np.array([55, 52, 48], dtype=np.float64)        # Dark groove/slot
+TRACK_BASE = np.array([145, 140, 130], dtype=np.float32)      # Brushed metal base
+TRACK_HIGHLIGHT = np.array([175, 170, 158], dtype=np.float32)  # Metal highlight
+TRACK_SHADOW = np.array([95, 90, 82], dtype=np.float32)        # Metal shadow
+TRACK_GROOVE = np.array([55, 52, 48], dtype=np.float32)        # Dark groove/slot
 
 # Wear zone colors (shifts applied to carpet)
 WEAR_DARKEN = 0.82    # How much to darken worn carpet
-WEAR_YELLOW_SHIFT = np.array([4, 2, -6], dtype=np.float64)  # Yellowing from age
+WEAR_YELLOW_SHIFT = np.array([4, 2, -6], dtype=np.float32)  # Yellowing from age
 
+# PSX-style checkerboard dither: +1 where (x + y) is even, -1 where odd
+DITHER_PATTERN = np.where(np.add.outer(np.arange(SIZE), np.arange(SIZE)) % 2 == 0, 1.0, -1.0).astype(np.float32)
 
-def load_carpet():
+# Brushed-metal variation along the track, periodic so it tiles horizontally
+_x = np.arange(SIZE)
+BRUSH_VAR = (np.sin(2 * pi * _x / SIZE * 16) * 3 + np.sin(2 * pi * _x / SIZE * 7) * 2)[:, None]
+
+
+@lru_cache(maxsize=1)
+def _decode_carpet(path):
     """
-    Load the base brown carpet texture. Returns a numpy array (float64, RGB).
-    The carpet is already 128x128 and tileable.
+    Decode the carpet at `path` once per process. Returns a read-only
+    float32 RGB array; callers must copy it before drawing on it.
     """
     try:
-        img = Image.open(CARPET_PATH).convert('RGB')
-        arr = np.array(img).astype(np.float64)
+        img = Image.open(path).convert('RGB')
+        arr = np.array(img).astype(np.float32)
         print(f"  Loaded carpet: {img.size[0]}x{img.size[1]}, mode={img.mode}")
-        return arr
     except FileNotFoundError:
-        print(f"  WARNING: Carpet not found at {CARPET_PATH}, generating procedural fallback")
+        print(f"  WARNING: Carpet not found at {path}, generating procedural fallback")
         # Procedural brown carpet fallback
-        arr = np.zeros((SIZE, SIZE, 3), dtype=np.float64)
-        for y in range(SIZE):
-            for x in range(SIZE):
-                base = np.array([115, 92, 64], dtype=np.float64)
-                noise = np.random.randn(3) * 8
-                arr[y, x] = base + noise
-        return arr
+        base = np.array([115, 92, 64], dtype=np.float32)
+        noise = np.random.default_rng(SEED).standard_normal((SIZE, SIZE, 3), dtype=np.float32) * 8
+        arr = base + noise
+    arr.flags.writeable = False
+    return arr
+
+
+def load_carpet():
+    """
+    Load the base brown carpet texture. Returns a numpy array (float32, RGB).
+    The carpet is already 128x128 and tileable. The PNG is only decoded on
+    the first call, so batch regeneration reuses it.
+    """
+    return _decode_carpet(CARPET_PATH).copy()
 
 
 def add_wear_zone(img, carpet_base):
@@ -77,42 +92,31 @@ def add_wear_zone(img, carpet_base):
     # Wear zone extends ~30px above and below the track center
     wear_radius = 30
 
-    for y in range(SIZE):
-        # Distance from the track center (in tile-wrapped space)
-        dist = abs(y - track_center_y)
-        # Handle wrapping: also check distance via the wrap-around path
-        dist_wrapped = SIZE - dist
-        dist = min(dist, dist_wrapped)
-
-        if dist >= wear_radius:
-            continue
-
-        # Smooth falloff: strongest near track, fading to zero at edge
-        # Using cosine falloff for smooth blending
-        t = dist / wear_radius
-        strength = 0.5 * (1.0 + cos(pi * t))  # 1.0 at center, 0.0 at edge
-
-        for x in range(SIZE):
-            # Darken the carpet
-            darken_factor = 1.0 - (1.0 - WEAR_DARKEN) * strength
-            img[y % SIZE, x % SIZE] = img[y % SIZE, x % SIZE] * darken_factor
-
-            # Add slight yellowing/discoloration
-            img[y % SIZE, x % SIZE] += WEAR_YELLOW_SHIFT * strength * 0.4
-
-            # Reduce carpet texture variation (matted/flattened carpet)
-            # Blend slightly toward the local average to simulate matting
-            carpet_val = carpet_base[y % SIZE, x % SIZE]
-            local_avg = np.mean(carpet_val)
-            flatten_strength = strength * 0.15
-            for c in range(3):
-                diff = img[y % SIZE, x % SIZE, c] - local_avg
-                img[y % SIZE, x % SIZE, c] -= diff * flatten_strength
+    # Distance from the track center (in tile-wrapped space), one per row
+    dist = np.abs(np.arange(SIZE) - track_center_y)
+    dist = np.minimum(dist, SIZE - dist)
+
+    # Only the rows inside the wear zone change
+    band = dist < wear_radius
+
+    # Smooth falloff: strongest near track, fading to zero at edge
+    # Using cosine falloff for smooth blending (1.0 at center, 0.0 at edge)
+    t = dist[band] / wear_radius
+    strength = 0.5 * (1.0 + np.cos(pi * t))[:, None, None]
+    flatten = strength * 0.15
+
+    # Darken the carpet, add slight yellowing/discoloration, then reduce
+    # carpet texture variation (matted/flattened carpet) by blending toward
+    # the local average -- folded into one scale and one offset per pixel
+    local_avg = carpet_base[band].mean(axis=2, keepdims=True)
+    scale = (1.0 - (1.0 - WEAR_DARKEN) * strength) * (1.0 - flatten)
+    offset = WEAR_YELLOW_SHIFT * strength * 0.4 * (1.0 - flatten) + local_avg * flatten
+    img[band] = img[band] * scale + offset
 
     return img
 
 
-def draw_door_track(img):
+def draw_door_track(img, rng):
     """
     Draw a thin metallic door track/strip running horizontally across the
     middle of the tile. This is the rail that the door slides along.
@@ -131,105 +135,86 @@ def draw_door_track(img):
     """
     track_top = SIZE // 2 - 3  # 7px tall, centered
 
-    for x in range(SIZE):
-        # Horizontal variation for brushed metal look
-        # Use periodic function so it tiles horizontally
-        brush_var = sin(2 * pi * x / SIZE * 16) * 3 + sin(2 * pi * x / SIZE * 7) * 2
-        spot_var = random.uniform(-2, 2)  # Per-pixel noise
-
-        # Row 0: Top shadow on carpet (track casts shadow on carpet above)
-        y = track_top
-        shadow_strength = 0.75 + random.uniform(-0.05, 0.05)
-        img[y % SIZE, x % SIZE] = img[y % SIZE, x % SIZE] * shadow_strength
-
-        # Row 1: Track top bevel (highlight - light catches the top edge)
-        y = track_top + 1
-        color = TRACK_HIGHLIGHT + brush_var + spot_var
-        img[y % SIZE, x % SIZE] = color
-
-        # Row 2: Track upper surface (brushed metal)
-        y = track_top + 2
-        color = TRACK_BASE + brush_var * 0.8 + spot_var
-        img[y % SIZE, x % SIZE] = color
-
-        # Row 3: Center groove/slot (dark line where door panel slides)
-        y = track_top + 3
-        groove_depth = random.uniform(-3, 3)
-        color = TRACK_GROOVE + groove_depth
-        img[y % SIZE, x % SIZE] = color
-
-        # Row 4: Track lower surface (brushed metal, slightly darker)
-        y = track_top + 4
-        color = TRACK_BASE * 0.92 + brush_var * 0.6 + spot_var
-        img[y % SIZE, x % SIZE] = color
-
-        # Row 5: Track bottom bevel (shadow edge)
-        y = track_top + 5
-        color = TRACK_SHADOW + brush_var * 0.5 + spot_var
-        img[y % SIZE, x % SIZE] = color
-
-        # Row 6: Bottom shadow on carpet (track casts shadow on carpet below)
-        y = track_top + 6
-        shadow_strength = 0.70 + random.uniform(-0.05, 0.05)
-        img[y % SIZE, x % SIZE] = img[y % SIZE, x % SIZE] * shadow_strength
+    # Per-pixel randoms, one per column
+    spot_var = rng.uniform(-2, 2, (SIZE, 1))
+    top_jitter = rng.uniform(-0.05, 0.05, (SIZE, 1))
+    groove_depth = rng.uniform(-3, 3, (SIZE, 1))
+    bottom_jitter = rng.uniform(-0.05, 0.05, (SIZE, 1))
+
+    # Row 0: Top shadow on carpet (track casts shadow on carpet above)
+    img[track_top] *= 0.75 + top_jitter
+
+    # Row 1: Track top bevel (highlight - light catches the top edge)
+    img[track_top + 1] = TRACK_HIGHLIGHT + BRUSH_VAR + spot_var
+
+    # Row 2: Track upper surface (brushed metal)
+    img[track_top + 2] = TRACK_BASE + BRUSH_VAR * 0.8 + spot_var
+
+    # Row 3: Center groove/slot (dark line where door panel slides)
+    img[track_top + 3] = TRACK_GROOVE + groove_depth
+
+    # Row 4: Track lower surface (brushed metal, slightly darker)
+    img[track_top + 4] = TRACK_BASE * 0.92 + BRUSH_VAR * 0.6 + spot_var
+
+    # Row 5: Track bottom bevel (shadow edge)
+    img[track_top + 5] = TRACK_SHADOW + BRUSH_VAR * 0.5 + spot_var
+
+    # Row 6: Bottom shadow on carpet (track casts shadow on carpet below)
+    img[track_top + 6] *= 0.70 + bottom_jitter
 
     return img, track_top
 
 
-def add_track_grime(img, track_top):
+def add_track_grime(img, track_top, rng):
     """
     Add dust, grime, and debris accumulation along the track edges.
     Dirt collects in the gap between the track and the carpet.
-    Uses modulo wrapping for all coordinates.
+    The track rows are always inside the tile; only the lint clumps can
+    cross an edge, so they alone use modulo wrapping.
     """
     track_height = 7
+    dust_base = np.array([90, 82, 60], dtype=np.float32)
 
-    for x in range(SIZE):
-        # Dust specks along the top edge of the track
-        if random.random() < 0.35:
-            y = (track_top - 1) % SIZE
-            dust_color = np.array([90, 82, 60], dtype=np.float64) + random.uniform(-10, 10)
-            blend = random.uniform(0.15, 0.35)
-            img[y, x % SIZE] = img[y, x % SIZE] * (1 - blend) + dust_color * blend
-
-        # Dust specks along the bottom edge of the track
-        if random.random() < 0.35:
-            y = (track_top + track_height) % SIZE
-            dust_color = np.array([90, 82, 60], dtype=np.float64) + random.uniform(-10, 10)
-            blend = random.uniform(0.15, 0.35)
-            img[y, x % SIZE] = img[y, x % SIZE] * (1 - blend) + dust_color * blend
-
-        # Occasional darker grime/crud in the groove itself
-        if random.random() < 0.2:
-            y = (track_top + 3) % SIZE  # The groove row
-            img[y, x % SIZE] = img[y, x % SIZE] * random.uniform(0.7, 0.9)
+    # Dust specks along the top and bottom edges of the track
+    for y in (track_top - 1, track_top + track_height):
+        xs = np.nonzero(rng.random(SIZE) < 0.35)[0]
+        dust_color = dust_base + rng.uniform(-10, 10, (xs.size, 1))
+        blend = rng.uniform(0.15, 0.35, (xs.size, 1))
+        img[y, xs] = img[y, xs] * (1 - blend) + dust_color * blend
+
+    # Occasional darker grime/crud in the groove itself
+    y = track_top + 3  # The groove row
+    xs = np.nonzero(rng.random(SIZE) < 0.2)[0]
+    img[y, xs] *= rng.uniform(0.7, 0.9, (xs.size, 1))
 
     # Clumps of lint/dust near the track (small irregular spots)
-    num_clumps = random.randint(8, 14)
-    for _ in range(num_clumps):
-        cx = random.randint(0, SIZE - 1)
-        # Position clumps near the track edges (above or below)
-        if random.random() < 0.5:
-            cy = (track_top - random.randint(1, 4)) % SIZE
-        else:
-            cy = (track_top + track_height + random.randint(0, 3)) % SIZE
-
-        clump_size = random.randint(1, 3)
-        for dy in range(-clump_size, clump_size + 1):
-            for dx in range(-clump_size, clump_size + 1):
-                if abs(dy) + abs(dx) > clump_size + 1:
-                    continue
-                if random.random() < 0.4:
-                    continue
-                yy = (cy + dy) % SIZE
-                xx = (cx + dx) % SIZE
-                darken = random.uniform(0.82, 0.92)
-                img[yy, xx] = img[yy, xx] * darken
+    num_clumps = rng.integers(8, 15)
+    cxs = rng.integers(0, SIZE, num_clumps)
+    # Position clumps near the track edges (above or below)
+    cys = np.where(rng.random(num_clumps) < 0.5,
+                   track_top - rng.integers(1, 5, num_clumps),
+                   track_top + track_height + rng.integers(0, 4, num_clumps))
+    clump_sizes = rng.integers(1, 4, num_clumps)
+
+    # Gather every clump pixel, then darken them all in one scatter
+    # (np.multiply.at compounds overlapping clumps in draw order)
+    clump_ys, clump_xs = [], []
+    for cx, cy, clump_size in zip(cxs, cys, clump_sizes):
+        dy, dx = np.mgrid[-clump_size:clump_size + 1, -clump_size:clump_size + 1]
+        diamond = np.abs(dy) + np.abs(dx) <= clump_size + 1
+        clump_ys.append(cy + dy[diamond])
+        clump_xs.append(cx + dx[diamond])
+    clump_ys = np.concatenate(clump_ys)
+    clump_xs = np.concatenate(clump_xs)
+    # Leave ~40% of each clump's pixels untouched for an irregular shape
+    keep = rng.random(clump_ys.size) >= 0.4
+    darken = rng.uniform(0.82, 0.92, (np.count_nonzero(keep), 1))
+    np.multiply.at(img, (clump_ys[keep] % SIZE, clump_xs[keep] % SIZE), darken)
 
     return img
 
 
-def add_door_scuff_marks(img, track_top):
+def add_door_scuff_marks(img, track_top, rng):
     """
     Add scuff marks from the door sliding. These are subtle arc-shaped
     or straight marks on the carpet near the track, where the bottom
@@ -242,46 +227,66 @@ def add_door_scuff_marks(img, track_top):
 
     # Main scuff zone: carpet on the side where door swings open
     # (above the track in our case, since door opens "away")
-    num_scuffs = random.randint(12, 20)
-    for _ in range(num_scuffs):
-        # Scuffs are short horizontal-ish marks
-        sx = random.randint(0, SIZE - 1)
-        # Position scuffs a few pixels from the track
-        sy = (track_center_y + random.choice([-1, 1]) * random.randint(5, 18)) % SIZE
-
-        scuff_len = random.randint(6, 22)
-        scuff_angle = random.uniform(-0.15, 0.15)  # Nearly horizontal
-        darken = random.uniform(0.82, 0.92)
-
-        for i in range(scuff_len):
-            px = (sx + int(i * cos(scuff_angle))) % SIZE
-            py = (sy + int(i * sin(scuff_angle))) % SIZE
-            img[py, px] = img[py, px] * darken
-            # Some scuffs are 2px wide
-            if random.random() < 0.4:
-                py2 = (py + 1) % SIZE
-                img[py2, px] = img[py2, px] * (darken * 1.03)
+    num_scuffs = rng.integers(12, 21)
+    # Scuffs are short horizontal-ish marks
+    scuff_xs = rng.integers(0, SIZE, num_scuffs)
+    # Position scuffs a few pixels from the track
+    scuff_ys = (track_center_y + rng.choice([-1, 1], num_scuffs) * rng.integers(5, 19, num_scuffs)) % SIZE
+    scuff_lens = rng.integers(6, 23, num_scuffs)
+    scuff_angles = rng.uniform(-0.15, 0.15, num_scuffs)  # Nearly horizontal
+    darkens = rng.uniform(0.82, 0.92, num_scuffs)
+    # Some scuffs are 2px wide
+    widen = rng.random(scuff_lens.sum()) < 0.4
+
+    # Every step of every scuff at once: step i of scuff s sits at
+    # (sx + int(i*cos), sy + int(i*sin)), optionally doubled one row down
+    scuff = np.repeat(np.arange(num_scuffs), scuff_lens)
+    i = np.arange(scuff.size) - np.repeat(np.cumsum(scuff_lens) - scuff_lens, scuff_lens)
+    px = (scuff_xs[scuff] + (i * np.cos(scuff_angles[scuff])).astype(int)) % SIZE
+    py = (scuff_ys[scuff] + (i * np.sin(scuff_angles[scuff])).astype(int)) % SIZE
+    darken = darkens[scuff]
+    # Interleave each step's pixel with its optional widening pixel so
+    # np.multiply.at compounds overlaps in the same order as drawing them
+    ys = np.stack([py, (py + 1) % SIZE], axis=1).ravel()
+    xs = np.repeat(px, 2)
+    factors = np.stack([darken, darken * 1.03], axis=1).ravel()
+    drawn = np.stack([np.ones_like(widen), widen], axis=1).ravel()
+    np.multiply.at(img, (ys[drawn], xs[drawn]), factors[drawn][:, None])
 
     # A few prominent arc-shaped scuffs (door bottom dragging on carpet)
-    num_arcs = random.randint(2, 4)
-    for _ in range(num_arcs):
-        arc_start_x = random.randint(0, SIZE - 1)
-        arc_y_base = (track_center_y + random.choice([-1, 1]) * random.randint(8, 20)) % SIZE
-        arc_len = random.randint(15, 40)
-        arc_curve = random.uniform(0.03, 0.08)  # Slight curve
-        darken = random.uniform(0.78, 0.88)
-
-        for i in range(arc_len):
-            px = (arc_start_x + i) % SIZE
-            # Gentle parabolic arc
-            arc_offset = int(arc_curve * (i - arc_len / 2) ** 2 - arc_curve * (arc_len / 2) ** 2)
-            py = (arc_y_base + arc_offset) % SIZE
-            img[py, px] = img[py, px] * darken
+    num_arcs = rng.integers(2, 5)
+    arc_start_xs = rng.integers(0, SIZE, num_arcs)
+    arc_y_bases = (track_center_y + rng.choice([-1, 1], num_arcs) * rng.integers(8, 21, num_arcs)) % SIZE
+    arc_lens = rng.integers(15, 41, num_arcs)
+    arc_curves = rng.uniform(0.03, 0.08, num_arcs)  # Slight curve
+    darkens = rng.uniform(0.78, 0.88, num_arcs)
+
+    arc = np.repeat(np.arange(num_arcs), arc_lens)
+    i = np.arange(arc.size) - np.repeat(np.cumsum(arc_lens) - arc_lens, arc_lens)
+    half = arc_lens[arc] / 2
+    px = (arc_start_xs[arc] + i) % SIZE
+    # Gentle parabolic arc
+    arc_offset = (arc_curves[arc] * (i - half) ** 2 - arc_curves[arc] * half ** 2).astype(int)
+    py = (arc_y_bases[arc] + arc_offset) % SIZE
+    np.multiply.at(img, (py, px), darkens[arc][:, None])
 
     return img
 
 
-def add_track_scratches(img, track_top):
+def scale_row_span(img, row, start_x, length, factor):
+    """
+    Multiply `length` pixels of one row by `factor`, starting at start_x and
+    wrapping past the right edge. Uses at most two contiguous slices.
+    """
+    end_x = start_x + length
+    if end_x <= SIZE:
+        img[row, start_x:end_x] *= factor
+    else:
+        img[row, start_x:] *= factor
+        img[row, :end_x - SIZE] *= factor
+
+
+def add_track_scratches(img, track_top, rng):
     """
     Add fine scratches on the metal track surface itself. These run
     horizontally (parallel to the track) from the door sliding back
@@ -289,114 +294,107 @@ def add_track_scratches(img, track_top):
     """
     track_surface_rows = [track_top + 1, track_top + 2, track_top + 4, track_top + 5]
 
-    num_scratches = random.randint(8, 15)
-    for _ in range(num_scratches):
-        row = random.choice(track_surface_rows)
-        start_x = random.randint(0, SIZE - 1)
-        length = random.randint(8, 45)
-        lighten = random.uniform(1.04, 1.14)
-
-        for i in range(length):
-            x = (start_x + i) % SIZE
-            y = row % SIZE
-            img[y, x] = img[y, x] * lighten
+    num_scratches = rng.integers(8, 16)
+    rows = rng.choice(track_surface_rows, num_scratches)
+    start_xs = rng.integers(0, SIZE, num_scratches)
+    lengths = rng.integers(8, 46, num_scratches)
+    lightens = rng.uniform(1.04, 1.14, num_scratches)
+    for row, start_x, length, lighten in zip(rows, start_xs, lengths, lightens):
+        scale_row_span(img, row, start_x, length, lighten)
 
     # A few deeper scratches (darker)
-    num_deep = random.randint(3, 6)
-    for _ in range(num_deep):
-        row = random.choice(track_surface_rows)
-        start_x = random.randint(0, SIZE - 1)
-        length = random.randint(5, 20)
-        darken = random.uniform(0.85, 0.93)
-
-        for i in range(length):
-            x = (start_x + i) % SIZE
-            y = row % SIZE
-            img[y, x] = img[y, x] * darken
+    num_deep = rng.integers(3, 7)
+    rows = rng.choice(track_surface_rows, num_deep)
+    start_xs = rng.integers(0, SIZE, num_deep)
+    lengths = rng.integers(5, 21, num_deep)
+    darkens = rng.uniform(0.85, 0.93, num_deep)
+    for row, start_x, length, darken in zip(rows, start_xs, lengths, darkens):
+        scale_row_span(img, row, start_x, length, darken)
 
     return img
 
 
-def add_track_wear_spots(img, track_top):
+def add_track_wear_spots(img, track_top, rng):
     """
     Add worn/polished spots on the track where it gets the most contact.
     These are brighter patches where the metal has been polished smooth
     by repeated door sliding.
     """
-    num_spots = random.randint(4, 8)
+    num_spots = rng.integers(4, 9)
     track_surface_rows = [track_top + 2, track_top + 4]  # The main surface rows
+    cxs = rng.integers(0, SIZE, num_spots)
+    rows = rng.choice(track_surface_rows, num_spots)
+    spot_widths = rng.integers(6, 19, num_spots)
 
-    for _ in range(num_spots):
-        cx = random.randint(0, SIZE - 1)
-        row = random.choice(track_surface_rows)
-        spot_width = random.randint(6, 18)
-
-        for dx in range(-spot_width // 2, spot_width // 2 + 1):
-            x = (cx + dx) % SIZE
-            # Smooth falloff from center
-            t = abs(dx) / (spot_width / 2)
-            brighten = 1.0 + (1.0 - t) * random.uniform(0.06, 0.12)
-            img[row % SIZE, x] = img[row % SIZE, x] * brighten
+    for cx, row, spot_width in zip(cxs, rows, spot_widths):
+        dx = np.arange(-spot_width // 2, spot_width // 2 + 1)
+        # Smooth falloff from center
+        t = np.abs(dx) / (spot_width / 2)
+        brighten = 1.0 + (1.0 - t) * rng.uniform(0.06, 0.12, dx.size)
+        img[row, (cx + dx) % SIZE] *= brighten[:, None]
 
     return img
 
 
-def add_carpet_stain_near_track(img, track_top):
+@lru_cache(maxsize=None)
+def stain_falloff(radius):
+    """
+    Disk mask and quadratic falloff (for the pixels inside the disk) of a
+    stain of the given radius. Radii come from a small range, so each
+    template is built once and shared.
+    """
+    dy, dx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    dist = np.sqrt(dx * dx + dy * dy)
+    inside = dist <= radius
+
+    falloff = 1.0 - (dist[inside] / radius)
+    falloff = falloff * falloff  # Quadratic falloff
+    return inside, falloff
+
+
+def add_carpet_stain_near_track(img, track_top, rng):
     """
     Add a couple of subtle stains/discoloration patches near the threshold.
     Doorways accumulate stains from foot traffic, spills, etc.
     All coordinates use modulo wrapping.
     """
     track_center_y = track_top + 3
-    num_stains = random.randint(3, 6)
-
-    for _ in range(num_stains):
-        cx = random.randint(0, SIZE - 1)
-        # Stains cluster near the track
-        cy = (track_center_y + random.choice([-1, 1]) * random.randint(8, 25)) % SIZE
-        radius = random.randint(5, 14)
-
-        stain_type = random.choice(["dark", "yellow"])
-
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                dist = sqrt(dx * dx + dy * dy)
-                if dist > radius:
-                    continue
-
-                falloff = 1.0 - (dist / radius)
-                falloff = falloff * falloff  # Quadratic falloff
-                strength = falloff * random.uniform(0.06, 0.14)
-
-                yy = (cy + dy) % SIZE
-                xx = (cx + dx) % SIZE
-
-                if stain_type == "dark":
-                    img[yy, xx] = img[yy, xx] * (1.0 - strength * 0.3)
-                else:
-                    shift = np.array([3, 1, -5], dtype=np.float64) * strength
-                    img[yy, xx] = img[yy, xx] + shift
+    num_stains = rng.integers(3, 7)
+    cxs = rng.integers(0, SIZE, num_stains)
+    # Stains cluster near the track
+    cys = (track_center_y + rng.choice([-1, 1], num_stains) * rng.integers(8, 26, num_stains)) % SIZE
+    radii = rng.integers(5, 15, num_stains)
+    stain_types = rng.choice(["dark", "yellow"], num_stains)
+
+    for cx, cy, radius, stain_type in zip(cxs, cys, radii, stain_types):
+        inside, falloff = stain_falloff(radius)
+        jitter = rng.uniform(0.06, 0.14, falloff.size)
+        strength = (falloff * jitter)[:, None]
+
+        index = np.ix_((cy + np.arange(-radius, radius + 1)) % SIZE,
+                       (cx + np.arange(-radius, radius + 1)) % SIZE)
+        region = img[index]
+        if stain_type == "dark":
+            region[inside] *= 1.0 - strength * 0.3
+        else:
+            region[inside] += np.array([3, 1, -5], dtype=np.float32) * strength
+        img[index] = region
 
     return img
 
 
-def add_psx_noise(img):
+def add_psx_noise(img, rng):
     """
     Add fine pixel-level noise across the entire texture for PSX grittiness.
     Plus a subtle dither pattern.
     """
-    # Per-pixel gaussian noise
-    noise = np.random.randn(SIZE, SIZE, 3) * 3.0
+    # Per-pixel gaussian noise plus a subtle checkerboard dither (PSX-like),
+    # combined in the noise buffer so the image is only touched once
+    noise = rng.standard_normal((SIZE, SIZE, 3), dtype=np.float32)
+    noise *= 3.0
+    noise += DITHER_PATTERN[:, :, None]
     img += noise
 
-    # Subtle checkerboard dither (PSX-like)
-    for y in range(SIZE):
-        for x in range(SIZE):
-            if (x + y) % 2 == 0:
-                img[y % SIZE, x % SIZE] += 1.0
-            else:
-                img[y % SIZE, x % SIZE] -= 1.0
-
     return img
 
 
@@ -404,24 +402,22 @@ def generate_tiled_preview(img_path):
     """
     Create a 2x2 tiled version to visually verify seamlessness.
     """
-    img = Image.open(img_path)
-    width, height = img.size
+    with Image.open(img_path) as img:
+        arr = np.asarray(img.convert('RGB'))
 
-    tiled = Image.new('RGB', (width * 2, height * 2))
-    tiled.paste(img, (0, 0))
-    tiled.paste(img, (width, 0))
-    tiled.paste(img, (0, height))
-    tiled.paste(img, (width, height))
+    tiled = Image.fromarray(np.tile(arr, (2, 2, 1)), mode='RGB')
 
     tiled.save(TILED_PATH)
     print(f"  Saved 2x2 tiled preview to {TILED_PATH}")
 
 
-def generate_door_threshold():
+def generate_door_threshold(seed=SEED):
     """
     Generate the complete open door threshold floor texture.
+    A single NumPy Generator drives every random draw.
     """
     print("Generating Backrooms open door threshold texture...")
+    rng = np.random.default_rng(seed)
 
     # Step 1: Load base carpet
     print("  Loading carpet texture...")
@@ -434,35 +430,37 @@ def generate_door_threshold():
 
     # Step 3: Add carpet stains near the threshold
     print("  Adding carpet stains near threshold...")
-    img = add_carpet_stain_near_track(img, SIZE // 2 - 3)
+    img = add_carpet_stain_near_track(img, SIZE // 2 - 3, rng)
 
     # Step 4: Add door scuff marks on the carpet
     print("  Adding door scuff marks...")
-    img = add_door_scuff_marks(img, SIZE // 2 - 3)
+    img = add_door_scuff_marks(img, SIZE // 2 - 3, rng)
 
     # Step 5: Draw the metallic door track
     print("  Drawing metallic door track...")
-    img, track_top = draw_door_track(img)
+    img, track_top = draw_door_track(img, rng)
 
     # Step 6: Add grime along the track edges
     print("  Adding track edge grime...")
-    img = add_track_grime(img, track_top)
+    img = add_track_grime(img, track_top, rng)
 
     # Step 7: Add scratches on the track metal
     print("  Adding track scratches...")
-    img = add_track_scratches(img, track_top)
+    img = add_track_scratches(img, track_top, rng)
 
     # Step 8: Add polished wear spots on the track
     print("  Adding track wear spots...")
-    img = add_track_wear_spots(img, track_top)
+    img = add_track_wear_spots(img, track_top, rng)
 
     # Step 9: PSX noise and dither
     print("  Adding PSX noise...")
-    img = add_psx_noise(img)
+    img = add_psx_noise(img, rng)
 
-    # Clamp to valid range
+    # Clamp to valid range and round (truncating would bias every pixel darker)
     print("  Clamping values...")
-    img = np.clip(img, 0, 255).astype(np.uint8)
+    np.clip(img, 0, 255, out=img)
+    np.rint(img, out=img)
+    img = img.astype(np.uint8)
 
     # Save
     result = Image.fromarray(img, mode='RGB')
@@ -474,10 +472,6 @@ def generate_door_threshold():
 
 
 if __name__ == "__main__":
-    # Fixed seed for reproducibility
-    np.random.seed(42)
-    random.seed(42)
-
     generate_door_threshold()
 
     # Verify output
@@ -5,6 +5,7 @@ PSX-style low-fi pixel art aesthetic with transparent background.
 """
 
 from PIL import Image, ImageDraw
+import numpy as np
 import math
 
 # Configuration
@@ -29,6 +30,10 @@ def create_exit_hole():
     center_x = SIZE // 2
     center_y = SIZE // 2
 
+    # Radial distance field shared by the ground texture and the shadow ring
+    y, x = np.ogrid[:SIZE, :SIZE]
+    dist = np.hypot(x - center_x, y - center_y).astype(np.float32)
+
     # Draw ground circle (the damaged area around the pit)
     ground_radius = 30
     draw.ellipse(
@@ -38,24 +43,15 @@ def create_exit_hole():
     )
 
     # Add some texture to the ground (pixel-level noise and cracks)
-    pixels = img.load()
+    arr = np.array(img)
 
     # Ground texture - subtle variation
-    for y in range(SIZE):
-        for x in range(SIZE):
-            dx = x - center_x
-            dy = y - center_y
-            dist = math.sqrt(dx**2 + dy**2)
-
-            # Only modify pixels within ground radius
-            if dist <= ground_radius and dist > 15:
-                current = pixels[x, y]
-                if current[3] > 0:  # If not transparent
-                    # Add subtle variation to ground color
-                    if (x + y) % 3 == 0:
-                        pixels[x, y] = GROUND_LIGHT + (255,)
-                    elif (x * 3 + y * 2) % 5 == 0:
-                        pixels[x, y] = GROUND_DARK + (255,)
+    # Only modify non-transparent pixels within ground radius
+    ring = (dist <= ground_radius) & (dist > 15) & (arr[:, :, 3] > 0)
+    light = ring & ((x + y) % 3 == 0)
+    dark = ring & ~light & ((x * 3 + y * 2) % 5 == 0)
+    arr[light] = GROUND_LIGHT + (255,)
+    arr[dark] = GROUND_DARK + (255,)
 
     # Draw radial cracks emanating from pit
     num_cracks = 8
@@ -65,17 +61,23 @@ def create_exit_hole():
         start_r = 16
         end_r = ground_radius - 2
 
-        for r in range(int(start_r), int(end_r), 2):
-            # Add some wobble to cracks
-            wobble = math.sin(r * 0.3 + i) * 1.5
-            x = int(center_x + math.cos(angle) * r + wobble)
-            y = int(center_y + math.sin(angle) * r + wobble)
-
-            if 0 <= x < SIZE and 0 <= y < SIZE:
-                # Draw crack pixel and neighbor for thickness
-                pixels[x, y] = CRACK_COLOR + (255,)
-                if x + 1 < SIZE:
-                    pixels[x + 1, y] = CRACK_COLOR + (200,)
+        r = np.arange(start_r, end_r, 2)
+        # Add some wobble to cracks
+        wobble = np.sin(r * 0.3 + i) * 1.5
+        cx = (center_x + math.cos(angle) * r + wobble).astype(int)
+        cy = (center_y + math.sin(angle) * r + wobble).astype(int)
+
+        # Crack pixel plus its right neighbour for thickness, interleaved
+        # per step so later steps still overwrite earlier ones
+        ys = np.repeat(cy, 2)
+        xs = np.stack([cx, cx + 1], axis=1).ravel()
+        alpha = np.tile([255, 200], r.size)
+        inside = np.repeat((0 <= cx) & (cx < SIZE) & (0 <= cy) & (cy < SIZE), 2) & (xs < SIZE)
+        arr[ys[inside], xs[inside], :3] = CRACK_COLOR
+        arr[ys[inside], xs[inside], 3] = alpha[inside]
+
+    img = Image.fromarray(arr, 'RGBA')
+    draw = ImageDraw.Draw(img)
 
     # Draw the pit itself (concentric darkening circles)
     # Outer pit edge
@@ -102,35 +104,25 @@ def create_exit_hole():
         fill=PIT_BLACK + (255,)
     )
 
+    arr = np.array(img)
+
     # Add some depth detail to pit edge (rough/jagged edge effect)
     for angle_deg in range(0, 360, 15):
         angle = math.radians(angle_deg)
         # Vary the radius slightly for each point
         r_var = pit_radius_outer + (1 if angle_deg % 30 == 0 else -1)
-        x = int(center_x + math.cos(angle) * r_var)
-        y = int(center_y + math.sin(angle) * r_var)
+        px = int(center_x + math.cos(angle) * r_var)
+        py = int(center_y + math.sin(angle) * r_var)
 
-        if 0 <= x < SIZE and 0 <= y < SIZE:
-            pixels[x, y] = CRACK_COLOR + (255,)
+        if 0 <= px < SIZE and 0 <= py < SIZE:
+            arr[py, px] = CRACK_COLOR + (255,)
 
     # Add subtle shadow gradient around pit edge (darkening effect)
-    for y in range(SIZE):
-        for x in range(SIZE):
-            dx = x - center_x
-            dy = y - center_y
-            dist = math.sqrt(dx**2 + dy**2)
-
-            # Shadow ring around pit
-            if 15 < dist < 20:
-                current = pixels[x, y]
-                if current[3] > 0:  # If not transparent
-                    # Darken pixels near pit edge
-                    factor = 0.7
-                    r = int(current[0] * factor)
-                    g = int(current[1] * factor)
-                    b = int(current[2] * factor)
-                    pixels[x, y] = (r, g, b, current[3])
+    # Darken non-transparent pixels in a ring around the pit edge
+    shadow = (dist > 15) & (dist < 20) & (arr[:, :, 3] > 0)
+    arr[shadow, :3] = (arr[shadow, :3] * 0.7).astype(np.uint8)
 
+    img = Image.fromarray(arr, 'RGBA')
     return img
 
 def main():
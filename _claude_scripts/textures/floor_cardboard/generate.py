@@ -4,14 +4,17 @@ Generate tileable floor cardboard texture for DEEP YELLOW.
 Loads existing carpet texture and overlays a flattened cardboard piece.
 """
 
+from functools import lru_cache
 from PIL import Image
 import numpy as np
-import random
 
 # Constants
 SIZE = 128
+assert SIZE & (SIZE - 1) == 0, "tile wrapping uses a bitmask, SIZE must be a power of two"
+MASK = SIZE - 1  # x & MASK == x % SIZE, negative offsets included
 CARPET_PATH = "../../../assets/levels/level_00/textures/carpet_brown.png"
 OUTPUT_PATH = "output.png"
+SEED = 42
 
 # Cardboard properties
 CARDBOARD_WIDTH = 70
@@ -21,40 +24,53 @@ CARDBOARD_CENTER_Y = SIZE // 2
 
 # Cardboard color — darker than carpet (mean ~115,92,64) for dirty/soggy look
 CARDBOARD_BASE_COLOR = (85, 70, 50)  # Dark, water-damaged cardboard
-
-def add_noise(img_array, intensity=10):
-    """Add subtle noise to break up uniformity."""
-    noise = np.random.randint(-intensity, intensity + 1, img_array.shape, dtype=np.int16)
-    noisy = np.clip(img_array.astype(np.int16) + noise, 0, 255).astype(np.uint8)
-    return noisy
-
-def draw_cardboard_pixel(img_array, x, y, base_color, edge_softness=0.0, corrugation_offset=0):
+DARKER_CREASE = tuple(max(0, c - 40) for c in CARDBOARD_BASE_COLOR)  # Darker crease
+TAPE_COLOR = tuple(min(255, c + 25) for c in CARDBOARD_BASE_COLOR)  # Lighter for tape residue
+WEAR_COLOR = tuple(max(0, c - 45) for c in CARDBOARD_BASE_COLOR)  # Darker wear marks
+CORRUGATION_LUT = np.array([10, -8, 0], dtype=np.int16)  # Ridge brightness by row % 3
+
+def add_noise(img_array, rng, intensity=10):
+    """Add subtle noise to break up uniformity, in place on an int16 image."""
+    img_array += rng.integers(-intensity, intensity + 1, img_array.shape, dtype=np.int16)
+    np.clip(img_array, 0, 255, out=img_array)
+
+@lru_cache(maxsize=None)
+def wear_disc(radius):
+    """Offsets and edge softness of every pixel inside a wear mark of the given radius."""
+    dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    dist = np.sqrt(dx**2 + dy**2)
+    inside = dist <= radius
+    # Soften edges of wear mark
+    return dx[inside], dy[inside], (dist[inside] / radius) * 0.6
+
+def draw_cardboard_pixels(img_array, xs, ys, base_color, rng, edge_softness=0.0, corrugation_offset=0):
     """
-    Draw a single cardboard pixel with proper blending.
+    Draw cardboard pixels at every (xs[i], ys[i]) with proper blending.
     edge_softness: 0.0 = full cardboard, 1.0 = full carpet (for antialiasing edges)
     corrugation_offset: brightness offset for corrugated texture
+    Both may be scalars or per-pixel arrays. The pixels must be distinct.
     """
-    if edge_softness >= 1.0:
-        return  # Fully transparent, skip
+    xs, ys, edge_softness, corrugation_offset = np.broadcast_arrays(
+        np.asarray(xs, dtype=int), np.asarray(ys, dtype=int),
+        np.asarray(edge_softness, dtype=float), np.asarray(corrugation_offset, dtype=int))
+    drawn = edge_softness < 1.0  # Fully transparent pixels are skipped
+    xs, ys = xs[drawn] & MASK, ys[drawn] & MASK
+    edge_softness = edge_softness[drawn][:, None]
+    corrugation_offset = corrugation_offset[drawn][:, None]
 
-    # Get current carpet color at this position (with modulo wrapping)
-    carpet_color = img_array[y % SIZE, x % SIZE].copy()
+    # Get current carpet color at these positions (with modulo wrapping)
+    carpet_color = img_array[ys, xs]
 
     # Vary the cardboard color slightly for texture
-    variation = np.random.randint(-8, 9, 3)
+    variation = rng.integers(-8, 9, (xs.size, 3))
     cardboard_color = np.clip(np.array(base_color) + variation + corrugation_offset, 0, 255)
 
     # Blend cardboard with carpet based on edge softness
-    if edge_softness > 0.0:
-        alpha = 1.0 - edge_softness
-        blended = (cardboard_color * alpha + carpet_color * (1.0 - alpha)).astype(np.uint8)
-    else:
-        blended = cardboard_color
+    alpha = 1.0 - edge_softness
+    blended = (cardboard_color * alpha + carpet_color * (1.0 - alpha)).astype(np.uint8)
+    img_array[ys, xs] = np.where(edge_softness > 0.0, blended, cardboard_color)
 
-    # Apply with modulo wrapping
-    img_array[y % SIZE, x % SIZE] = blended
-
-def draw_cardboard_box(img_array):
+def draw_cardboard_box(img_array, rng):
     """
     Draw a flattened cardboard piece on the carpet.
     The cardboard is rectangular with ragged/torn edges and corrugated texture.
@@ -66,87 +82,65 @@ def draw_cardboard_box(img_array):
     bottom = CARDBOARD_CENTER_Y + CARDBOARD_HEIGHT // 2
 
     # Draw cardboard with corrugated texture and ragged edges
-    for y in range(top, bottom):
-        for x in range(left, right):
-            # Calculate distance from cardboard edges
-            dist_from_left = x - left
-            dist_from_right = right - x - 1
-            dist_from_top = y - top
-            dist_from_bottom = bottom - y - 1
-
-            # Find minimum distance to any edge
-            min_edge_dist = min(dist_from_left, dist_from_right, dist_from_top, dist_from_bottom)
-
-            # CORRUGATED TEXTURE - horizontal ridges (key cardboard visual!)
-            # Ridges are ~2-3 pixels apart
-            ridge_pattern = (y % 3)  # 0, 1, 2 repeating pattern
-            if ridge_pattern == 0:
-                corrugation = 10  # Ridge peak (lighter)
-            elif ridge_pattern == 1:
-                corrugation = -8  # Valley (darker)
-            else:
-                corrugation = 0  # Transition
-
-            # MORE RAGGED/TORN edges - larger random cutouts
-            if min_edge_dist < 5:
-                # Much higher chance of torn edges
-                if random.random() < 0.5:  # 50% chance near edges
-                    continue
-                # Add extra jaggedness
-                if min_edge_dist < 3 and random.random() < 0.6:
-                    continue
-                # Soften the edge
-                edge_softness = 0.4 if min_edge_dist < 2 else 0.1
-            else:
-                edge_softness = 0.0
-
-            draw_cardboard_pixel(img_array, x, y, CARDBOARD_BASE_COLOR, edge_softness, corrugation)
+    ys = np.arange(top, bottom)[:, None]
+    xs = np.arange(left, right)[None, :]
+
+    # Find minimum distance to any cardboard edge
+    min_edge_dist = np.minimum(np.minimum(xs - left, right - xs - 1),
+                               np.minimum(ys - top, bottom - ys - 1))
+
+    # CORRUGATED TEXTURE - horizontal ridges (key cardboard visual!)
+    # Ridges are ~2-3 pixels apart: peak (lighter), valley (darker), transition
+    corrugation = CORRUGATION_LUT[ys % 3]
+    corrugation = np.broadcast_to(corrugation, min_edge_dist.shape)
+
+    # MORE RAGGED/TORN edges - larger random cutouts
+    # Much higher chance of torn edges (50% near edges), plus extra
+    # jaggedness right at the border
+    torn = (rng.random(min_edge_dist.shape) < 0.5) | (
+        (min_edge_dist < 3) & (rng.random(min_edge_dist.shape) < 0.6))
+    keep = ~((min_edge_dist < 5) & torn)
+
+    # Soften the edge
+    edge_softness = np.where(min_edge_dist < 5, np.where(min_edge_dist < 2, 0.4, 0.1), 0.0)
+
+    ys, xs = np.broadcast_arrays(ys, xs)
+    draw_cardboard_pixels(img_array, xs[keep], ys[keep], CARDBOARD_BASE_COLOR, rng,
+                          edge_softness[keep], corrugation[keep])
 
     # Add PROMINENT crease lines (fold marks) - darker and more visible
     # Horizontal crease near top third
     crease_y = top + CARDBOARD_HEIGHT // 3
-    for x in range(left + 5, right - 5):
-        if random.random() < 0.8:  # More continuous line
-            darker_color = tuple(max(0, c - 40) for c in CARDBOARD_BASE_COLOR)  # Darker crease
-            draw_cardboard_pixel(img_array, x, crease_y, darker_color, 0.0, 0)
-            # Shadow below crease
-            if random.random() < 0.7:
-                draw_cardboard_pixel(img_array, x, crease_y + 1, darker_color, 0.3, 0)
+    xs = np.arange(left + 5, right - 5)
+    crease_xs = xs[rng.random(xs.size) < 0.8]  # More continuous line
+    draw_cardboard_pixels(img_array, crease_xs, crease_y, DARKER_CREASE, rng, 0.0, 0)
+    # Shadow below crease
+    shadow_xs = crease_xs[rng.random(crease_xs.size) < 0.7]
+    draw_cardboard_pixels(img_array, shadow_xs, crease_y + 1, DARKER_CREASE, rng, 0.3, 0)
 
     # Vertical crease near center
-    crease_x = CARDBOARD_CENTER_X + random.randint(-5, 5)
-    for y in range(top + 5, bottom - 10):
-        if random.random() < 0.8:  # More continuous line
-            darker_color = tuple(max(0, c - 40) for c in CARDBOARD_BASE_COLOR)
-            draw_cardboard_pixel(img_array, crease_x, y, darker_color, 0.0, 0)
+    crease_x = CARDBOARD_CENTER_X + rng.integers(-5, 6)
+    ys = np.arange(top + 5, bottom - 10)
+    crease_ys = ys[rng.random(ys.size) < 0.8]  # More continuous line
+    draw_cardboard_pixels(img_array, crease_x, crease_ys, DARKER_CREASE, rng, 0.0, 0)
 
     # Add tape residue marks (lighter rectangular spots)
     for _ in range(3):
-        tape_x = random.randint(left + 15, right - 15)
-        tape_y = random.randint(top + 10, bottom - 10)
-        tape_width = random.randint(8, 15)
-        tape_height = random.randint(3, 5)
-        tape_color = tuple(min(255, c + 25) for c in CARDBOARD_BASE_COLOR)  # Lighter for tape residue
+        tape_x = rng.integers(left + 15, right - 14)
+        tape_y = rng.integers(top + 10, bottom - 9)
+        tape_width = rng.integers(8, 16)
+        tape_height = rng.integers(3, 6)
 
-        for dy in range(tape_height):
-            for dx in range(tape_width):
-                if random.random() < 0.7:  # Patchy tape residue
-                    draw_cardboard_pixel(img_array, tape_x + dx, tape_y + dy, tape_color, 0.2, 0)
+        dys, dxs = np.nonzero(rng.random((tape_height, tape_width)) < 0.7)  # Patchy tape residue
+        draw_cardboard_pixels(img_array, tape_x + dxs, tape_y + dys, TAPE_COLOR, rng, 0.2, 0)
 
     # Add some wear marks (darker spots) - more prominent
-    for _ in range(10):
-        wear_x = random.randint(left + 10, right - 10)
-        wear_y = random.randint(top + 10, bottom - 10)
-        wear_radius = random.randint(4, 9)
-        wear_color = tuple(max(0, c - 45) for c in CARDBOARD_BASE_COLOR)  # Darker wear marks
-
-        for dy in range(-wear_radius, wear_radius + 1):
-            for dx in range(-wear_radius, wear_radius + 1):
-                dist = np.sqrt(dx**2 + dy**2)
-                if dist <= wear_radius:
-                    # Soften edges of wear mark
-                    softness = (dist / wear_radius) * 0.6
-                    draw_cardboard_pixel(img_array, wear_x + dx, wear_y + dy, wear_color, softness, 0)
+    wear_xs = rng.integers(left + 10, right - 9, 10)
+    wear_ys = rng.integers(top + 10, bottom - 9, 10)
+    wear_radii = rng.integers(4, 10, 10)
+    for wear_x, wear_y, wear_radius in zip(wear_xs, wear_ys, wear_radii):
+        dxs, dys, softness = wear_disc(int(wear_radius))
+        draw_cardboard_pixels(img_array, wear_x + dxs, wear_y + dys, WEAR_COLOR, rng, softness, 0)
 
 def main():
     # Load base carpet texture
@@ -158,20 +152,22 @@ def main():
         print(f"Warning: Carpet texture is {carpet.size}, resizing to {SIZE}x{SIZE}")
         carpet = carpet.resize((SIZE, SIZE), Image.Resampling.LANCZOS)
 
-    # Convert to numpy array for manipulation
-    img_array = np.array(carpet, dtype=np.uint8)
+    # Convert to numpy array for manipulation. The whole pipeline works on
+    # one int16 buffer so the final noise pass needs no widening copy.
+    img_array = np.array(carpet, dtype=np.int16)
+    rng = np.random.default_rng(SEED)
 
     print("Drawing cardboard piece...")
     # Draw the cardboard box on top of carpet
-    draw_cardboard_box(img_array)
+    draw_cardboard_box(img_array, rng)
 
     # Add very subtle noise to the whole thing for PSX grittiness
     print("Adding subtle noise for PSX aesthetic...")
-    img_array = add_noise(img_array, intensity=3)
+    add_noise(img_array, rng, intensity=3)
 
     # Convert back to PIL Image and save
     print(f"Saving to {OUTPUT_PATH}...")
-    output_img = Image.fromarray(img_array, mode='RGB')
+    output_img = Image.fromarray(img_array.astype(np.uint8), mode='RGB')
     output_img.save(OUTPUT_PATH)
 
     print(f"✓ Generated {SIZE}x{SIZE} tileable floor cardboard texture")
@@ -12,12 +12,12 @@ Creates a water puddle on brown carpet by:
 
 from PIL import Image
 import numpy as np
-import math
 
 # Constants
 SIZE = 128
 BASE_CARPET_PATH = "../../../assets/levels/level_00/textures/carpet_brown.png"
 OUTPUT_PATH = "output.png"
+SEED = 42
 
 def load_base_carpet():
     """Load the base brown carpet texture."""
@@ -25,9 +25,9 @@ def load_base_carpet():
     # Ensure it's 128x128
     if img.size != (SIZE, SIZE):
         img = img.resize((SIZE, SIZE), Image.Resampling.NEAREST)
-    return np.array(img, dtype=np.float32)
+    return np.array(img, dtype=np.int32)
 
-def create_puddle_mask(size):
+def create_puddle_mask(size, rng):
     """
     Create a puddle-shaped alpha mask using Perlin-like noise.
     Returns values from 0 (dry) to 1 (fully wet).
@@ -48,33 +48,31 @@ def create_puddle_mask(size):
         (cx + 5, cy + 20, 18, 0.6),  # Small lobe bottom
     ]
 
+    yy, xx = np.ogrid[:size, :size]
     for center_x, center_y, radius, intensity in puddle_regions:
-        for y in range(size):
-            for x in range(size):
-                # Use modulo wrapping for toroidal distance calculation
-                # This ensures the puddle tiles seamlessly
-                dx_raw = x - center_x
-                dy_raw = y - center_y
+        # Use modulo wrapping for toroidal distance calculation
+        # This ensures the puddle tiles seamlessly
+        dx = np.abs(xx - center_x)
+        dy = np.abs(yy - center_y)
+        dx = np.minimum(dx, size - dx)
+        dy = np.minimum(dy, size - dy)
 
-                # Wrap around edges (toroidal distance)
-                dx = min(abs(dx_raw), size - abs(dx_raw))
-                dy = min(abs(dy_raw), size - abs(dy_raw))
+        dist2 = dx * dx + dy * dy
+        inside = dist2 < radius * radius
 
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist < radius:
-                    # Smooth falloff from center
-                    falloff = 1.0 - (dist / radius) ** 1.5
-                    mask[y, x] = max(mask[y, x], falloff * intensity)
+        # Smooth falloff from center (sqrt only where it is needed)
+        falloff = np.zeros((size, size))
+        falloff[inside] = (1.0 - (np.sqrt(dist2[inside]) / radius) ** 1.5) * intensity
+        mask = np.maximum(mask, falloff).astype(np.float32)
 
     # Add organic noise to puddle edges
-    np.random.seed(42)  # Reproducible
-    noise = np.random.rand(size, size) * 0.2 - 0.1
+    noise = rng.random((size, size)) * 0.2 - 0.1
     mask = np.clip(mask + noise, 0, 1)
 
-    # Smooth the mask slightly to reduce harsh edges
+    # Smooth the mask slightly to reduce harsh edges (wrapping, so the blur
+    # stays seamless across tile edges)
     from scipy.ndimage import gaussian_filter
-    mask = gaussian_filter(mask, sigma=2.0)
+    mask = gaussian_filter(mask, sigma=2.0, mode='wrap')
 
     return mask
 
@@ -85,48 +83,46 @@ def apply_puddle_effect(carpet_array, puddle_mask):
     - Darken the carpet in wet areas
     - Add blue/grey tint
     - Add subtle highlights for water reflection
+
+    The blend runs in integer fixed point (1.0 == 256, >> 8 to rescale);
+    the 8-bit colour products need int32 headroom.
     """
     result = carpet_array.copy()
 
     # Water color tint (dark blue-grey)
-    water_tint = np.array([60, 70, 85], dtype=np.float32)
+    water_tint = np.array([60, 70, 85], dtype=np.int32)
 
-    # For each pixel, blend between dry carpet and wet carpet
-    for y in range(SIZE):
-        for x in range(SIZE):
-            wetness = puddle_mask[y, x]
+    # Blend between dry carpet and wet carpet (only wet areas change)
+    wet = puddle_mask > 0.01
+    carpet = carpet_array[wet]
+    wetness = np.rint(puddle_mask[wet] * 256).astype(np.int32)[:, None]
+    dryness = 256 - wetness
 
-            if wetness > 0.01:  # Only process wet areas
-                dry_color = carpet_array[y, x]
+    # Wet effect: darken and add blue tint
+    darkened = (carpet * (128 + ((77 * dryness) >> 8))) >> 8  # 0.5 + 0.3 * dryness, darker when wetter
+    wet_color = (darkened * 179 + water_tint * 77) >> 8  # 70/30 mix in water tint
 
-                # Wet effect: darken and add blue tint
-                darkened = dry_color * (0.5 + 0.3 * (1 - wetness))  # Darker when wetter
-                wet_color = darkened * 0.7 + water_tint * 0.3  # Mix in water tint
-
-                # Blend based on wetness
-                result[y, x] = dry_color * (1 - wetness) + wet_color * wetness
+    # Blend based on wetness
+    result[wet] = (carpet * dryness + wet_color * wetness) >> 8
 
     # Add subtle specular highlights on water surface
     # Highlights appear at certain angles (simulate light reflection)
     highlight_center_x = SIZE // 2 + 20
     highlight_center_y = SIZE // 2 - 15
 
-    for y in range(SIZE):
-        for x in range(SIZE):
-            wetness = puddle_mask[y, x]
-
-            if wetness > 0.3:  # Only on wet areas
-                # Calculate distance to highlight center (with wrapping)
-                dx_raw = x - highlight_center_x
-                dy_raw = y - highlight_center_y
-                dx = min(abs(dx_raw), SIZE - abs(dx_raw))
-                dy = min(abs(dy_raw), SIZE - abs(dy_raw))
-                dist = math.sqrt(dx * dx + dy * dy)
+    # Calculate distance to highlight center (with wrapping)
+    yy, xx = np.ogrid[:SIZE, :SIZE]
+    dx = np.abs(xx - highlight_center_x)
+    dy = np.abs(yy - highlight_center_y)
+    dx = np.minimum(dx, SIZE - dx)
+    dy = np.minimum(dy, SIZE - dy)
+    dist2 = dx * dx + dy * dy
 
-                # Create a soft highlight spot
-                if dist < 30:
-                    highlight_strength = (1.0 - dist / 30) ** 2 * wetness * 0.25
-                    result[y, x] = np.clip(result[y, x] + highlight_strength * 80, 0, 255)
+    # Create a soft highlight spot, only on wet areas
+    spot = (puddle_mask > 0.3) & (dist2 < 30 * 30)
+    highlight_strength = (1.0 - np.sqrt(dist2[spot]) / 30) ** 2 * puddle_mask[spot] * 0.25
+    highlight = (highlight_strength * 80).astype(np.int32)[:, None]
+    result[spot] = np.minimum(result[spot] + highlight, 255)
 
     return result
 
@@ -135,7 +131,8 @@ def main():
     carpet = load_base_carpet()
 
     print("Generating puddle mask...")
-    puddle_mask = create_puddle_mask(SIZE)
+    rng = np.random.default_rng(SEED)  # Reproducible
+    puddle_mask = create_puddle_mask(SIZE, rng)
 
     print("Applying puddle effect...")
     result = apply_puddle_effect(carpet, puddle_mask)
@@ -11,7 +11,8 @@ fluorescent tubes glowing inside. Viewed from below, the dominant visual is
 the bright diffuser panel framed by a thin metal housing edge.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
+import numpy as np
 import shutil
 import os
 
@@ -50,18 +51,12 @@ GLOW_OUTER = (255, 235, 170, 18)        # Faint outer glow
 
 
 def create_image():
-    """Create a blank 64x64 RGBA image with transparent background."""
-    return Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
+    """Create a blank 64x64 RGBA pixel array with transparent background."""
+    return np.zeros((SIZE, SIZE, 4), dtype=np.uint8)
 
 
-def draw_glow(img):
+def draw_glow(arr):
     """Draw a soft rectangular glow halo around the fixture area."""
-    pixels = img.load()
-
-    # Center of fixture
-    cx = SIZE // 2
-    cy = SIZE // 2
-
     # Glow extends beyond the fixture bounds
     glow_layers = [
         # (x_expand, y_expand, color)
@@ -71,32 +66,25 @@ def draw_glow(img):
     ]
 
     for x_exp, y_exp, color in glow_layers:
-        gx1 = FIXTURE_X - x_exp
-        gy1 = FIXTURE_Y - y_exp
-        gx2 = FIXTURE_X + FIXTURE_W + x_exp - 1
-        gy2 = FIXTURE_Y + FIXTURE_H + y_exp - 1
+        gx1 = max(0, FIXTURE_X - x_exp)
+        gy1 = max(0, FIXTURE_Y - y_exp)
+        gx2 = min(SIZE - 1, FIXTURE_X + FIXTURE_W + x_exp - 1)
+        gy2 = min(SIZE - 1, FIXTURE_Y + FIXTURE_H + y_exp - 1)
 
-        for y in range(max(0, gy1), min(SIZE, gy2 + 1)):
-            for x in range(max(0, gx1), min(SIZE, gx2 + 1)):
-                # Skip pixels that are inside the fixture (will be drawn later)
-                if (FIXTURE_X <= x < FIXTURE_X + FIXTURE_W and
-                        FIXTURE_Y <= y < FIXTURE_Y + FIXTURE_H):
-                    continue
+        # Skip pixels that are inside the fixture (will be drawn later)
+        y, x = np.ogrid[gy1:gy2 + 1, gx1:gx2 + 1]
+        ring = ~((FIXTURE_X <= x) & (x < FIXTURE_X + FIXTURE_W) &
+                 (FIXTURE_Y <= y) & (y < FIXTURE_Y + FIXTURE_H))
 
-                # Current pixel
-                r0, g0, b0, a0 = pixels[x, y]
+        # Alpha blend
+        region = arr[gy1:gy2 + 1, gx1:gx2 + 1]
+        alpha = color[3] / 255.0
+        rgb = region[ring, :3] * (1 - alpha) + np.array(color[:3]) * alpha
+        region[ring, :3] = rgb.astype(np.uint8)
+        region[ring, 3] = np.minimum(255, region[ring, 3].astype(int) + color[3])
 
-                # Alpha blend
-                alpha = color[3] / 255.0
-                r = int(r0 * (1 - alpha) + color[0] * alpha)
-                g = int(g0 * (1 - alpha) + color[1] * alpha)
-                b = int(b0 * (1 - alpha) + color[2] * alpha)
-                a = min(255, a0 + color[3])
 
-                pixels[x, y] = (r, g, b, a)
-
-
-def draw_housing(draw):
+def draw_housing(arr):
     """Draw the metal housing frame of the fixture."""
     x1 = FIXTURE_X
     y1 = FIXTURE_Y
@@ -106,17 +94,17 @@ def draw_housing(draw):
     frame_thickness = 3
 
     # Outer frame rectangle
-    draw.rectangle([x1, y1, x2, y2], fill=HOUSING_OUTER)
+    arr[y1:y2 + 1, x1:x2 + 1] = HOUSING_OUTER
 
     # Highlight on top and left edges (light coming from above/left)
     # Top edge highlight
-    draw.line([(x1, y1), (x2, y1)], fill=HOUSING_INNER, width=1)
+    arr[y1, x1:x2 + 1] = HOUSING_INNER
     # Left edge highlight
-    draw.line([(x1, y1), (x1, y2)], fill=HOUSING_INNER, width=1)
+    arr[y1:y2 + 1, x1] = HOUSING_INNER
 
     # Shadow on bottom and right edges
-    draw.line([(x1, y2), (x2, y2)], fill=HOUSING_SHADOW, width=1)
-    draw.line([(x2, y1), (x2, y2)], fill=HOUSING_SHADOW, width=1)
+    arr[y2, x1:x2 + 1] = HOUSING_SHADOW
+    arr[y1:y2 + 1, x2] = HOUSING_SHADOW
 
     # Inner cutout (where the diffuser panel sits) - slightly recessed
     inner_x1 = x1 + frame_thickness
@@ -125,43 +113,31 @@ def draw_housing(draw):
     inner_y2 = y2 - frame_thickness
 
     # Inner bevel shadow (makes it look recessed)
-    draw.line([(inner_x1 - 1, inner_y1 - 1), (inner_x2 + 1, inner_y1 - 1)],
-              fill=HOUSING_SHADOW, width=1)
-    draw.line([(inner_x1 - 1, inner_y1 - 1), (inner_x1 - 1, inner_y2 + 1)],
-              fill=HOUSING_SHADOW, width=1)
+    arr[inner_y1 - 1, inner_x1 - 1:inner_x2 + 2] = HOUSING_SHADOW
+    arr[inner_y1 - 1:inner_y2 + 2, inner_x1 - 1] = HOUSING_SHADOW
 
     return inner_x1, inner_y1, inner_x2, inner_y2
 
 
-def draw_diffuser(draw, inner_x1, inner_y1, inner_x2, inner_y2):
+def draw_diffuser(arr, inner_x1, inner_y1, inner_x2, inner_y2):
     """Draw the translucent diffuser panel that covers the tubes."""
     # Fill diffuser area with mid-tone
-    draw.rectangle([inner_x1, inner_y1, inner_x2, inner_y2],
-                   fill=DIFFUSER_MID)
+    panel = arr[inner_y1:inner_y2 + 1, inner_x1:inner_x2 + 1]
+    panel[:] = DIFFUSER_MID
 
     # Slightly brighter center band
     center_y = (inner_y1 + inner_y2) // 2
-    draw.rectangle([inner_x1 + 2, center_y - 2, inner_x2 - 2, center_y + 2],
-                   fill=DIFFUSER_BRIGHT)
+    arr[center_y - 2:center_y + 3, inner_x1 + 2:inner_x2 - 1] = DIFFUSER_BRIGHT
 
     # Dimmer edges of diffuser (1px border inside)
-    # Top edge
-    draw.line([(inner_x1, inner_y1), (inner_x2, inner_y1)],
-              fill=DIFFUSER_EDGE, width=1)
-    # Bottom edge
-    draw.line([(inner_x1, inner_y2), (inner_x2, inner_y2)],
-              fill=DIFFUSER_EDGE, width=1)
-    # Left edge
-    draw.line([(inner_x1, inner_y1), (inner_x1, inner_y2)],
-              fill=DIFFUSER_EDGE, width=1)
-    # Right edge
-    draw.line([(inner_x2, inner_y1), (inner_x2, inner_y2)],
-              fill=DIFFUSER_EDGE, width=1)
-
-
-def draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2):
+    panel[0] = DIFFUSER_EDGE       # Top edge
+    panel[-1] = DIFFUSER_EDGE      # Bottom edge
+    panel[:, 0] = DIFFUSER_EDGE    # Left edge
+    panel[:, -1] = DIFFUSER_EDGE   # Right edge
+
+
+def draw_tubes(arr, inner_x1, inner_y1, inner_x2, inner_y2):
     """Draw two fluorescent tubes visible through the diffuser."""
-    pixels = img.load()
 
     tube_margin_x = 4  # Gap from diffuser edge to tube end
     tube_start_x = inner_x1 + tube_margin_x
@@ -178,68 +154,36 @@ def draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2):
 
     tube_half_height = 2  # Each tube is ~5px tall (2 above center, center, 2 below)
 
+    # Every tube color is fully opaque, so "blending" is a straight copy
     for tube_cy in tube_centers:
-        for x in range(tube_start_x, tube_end_x + 1):
-            for dy in range(-tube_half_height, tube_half_height + 1):
-                y = tube_cy + dy
-                if y < inner_y1 or y > inner_y2:
-                    continue
-
-                # Determine color based on position
-                if x < tube_start_x + cap_width or x > tube_end_x - cap_width:
-                    # End cap region
-                    color = TUBE_CAP
-                elif abs(dy) == tube_half_height:
-                    # Top/bottom edge of tube
-                    color = TUBE_MID
-                elif abs(dy) == tube_half_height - 1:
-                    # Near-edge
-                    color = TUBE_MID
-                else:
-                    # Bright center
-                    color = TUBE_BRIGHT
-
-                # Alpha blend onto existing pixel
-                r0, g0, b0, a0 = pixels[x, y]
-                alpha = color[3] / 255.0
-
-                r = int(r0 * (1 - alpha) + color[0] * alpha)
-                g = int(g0 * (1 - alpha) + color[1] * alpha)
-                b = int(b0 * (1 - alpha) + color[2] * alpha)
-                a = max(a0, color[3])
-
-                pixels[x, y] = (r, g, b, a)
-
-
-def draw_fixture_details(img):
-    """Add small details: center divider bar, mounting clips."""
-    pixels = img.load()
+        y0 = max(inner_y1, tube_cy - tube_half_height)
+        y1 = min(inner_y2, tube_cy + tube_half_height) + 1
+        tube = arr[y0:y1, tube_start_x:tube_end_x + 1]
+
+        # Top/bottom edge and near-edge rows of the tube
+        tube[:] = TUBE_MID
+        # Bright center
+        arr[tube_cy, tube_start_x:tube_end_x + 1] = TUBE_BRIGHT
+        # End cap regions
+        tube[:, :cap_width] = TUBE_CAP
+        tube[:, -cap_width:] = TUBE_CAP
 
-    cx = SIZE // 2
+
+def draw_fixture_details(arr):
+    """Add small details: center divider bar, mounting clips."""
     cy = SIZE // 2
 
     # Center divider bar (thin horizontal metal strip between tubes)
     divider_color = (155, 150, 140, 255)
     divider_y = cy
-    for x in range(FIXTURE_X + 5, FIXTURE_X + FIXTURE_W - 5):
-        pixels[x, divider_y] = divider_color
+    arr[divider_y, FIXTURE_X + 5:FIXTURE_X + FIXTURE_W - 5] = divider_color
 
     # Small mounting detail marks at the ends (tiny darker rectangles)
     mount_color = HOUSING_SHADOW
     # Left mount
-    for dy in range(-1, 2):
-        for dx in range(0, 2):
-            y = cy + dy
-            x = FIXTURE_X + 1 + dx
-            if 0 <= x < SIZE and 0 <= y < SIZE:
-                pixels[x, y] = mount_color
+    arr[cy - 1:cy + 2, FIXTURE_X + 1:FIXTURE_X + 3] = mount_color
     # Right mount
-    for dy in range(-1, 2):
-        for dx in range(0, 2):
-            y = cy + dy
-            x = FIXTURE_X + FIXTURE_W - 2 - dx
-            if 0 <= x < SIZE and 0 <= y < SIZE:
-                pixels[x, y] = mount_color
+    arr[cy - 1:cy + 2, FIXTURE_X + FIXTURE_W - 3:FIXTURE_X + FIXTURE_W - 1] = mount_color
 
 
 def generate_fluorescent_light():
@@ -247,30 +191,30 @@ def generate_fluorescent_light():
     print("Generating fluorescent ceiling light sprite (64x64 RGBA)...")
 
     # Step 1: Create blank image
-    img = create_image()
+    arr = create_image()
 
     # Step 2: Draw glow halo (behind everything)
     print("  - Drawing glow halo...")
-    draw_glow(img)
+    draw_glow(arr)
 
     # Step 3: Draw metal housing frame
     print("  - Drawing metal housing frame...")
-    draw = ImageDraw.Draw(img)
-    inner_x1, inner_y1, inner_x2, inner_y2 = draw_housing(draw)
+    inner_x1, inner_y1, inner_x2, inner_y2 = draw_housing(arr)
 
     # Step 4: Draw diffuser panel
     print("  - Drawing diffuser panel...")
-    draw_diffuser(draw, inner_x1, inner_y1, inner_x2, inner_y2)
+    draw_diffuser(arr, inner_x1, inner_y1, inner_x2, inner_y2)
 
     # Step 5: Draw fluorescent tubes (visible through diffuser)
     print("  - Drawing fluorescent tubes...")
-    draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2)
+    draw_tubes(arr, inner_x1, inner_y1, inner_x2, inner_y2)
 
     # Step 6: Add fixture details
     print("  - Adding fixture details...")
-    draw_fixture_details(img)
+    draw_fixture_details(arr)
 
     # Save output
+    img = Image.fromarray(arr, "RGBA")
     img.save(OUTPUT_PATH)
     print(f"  Saved to {OUTPUT_PATH}")
 
@@ -285,13 +229,9 @@ def generate_fluorescent_light():
     print(f"  Mode: {img.mode}")
 
     # Count transparent vs opaque pixels
-    pixels = img.load()
-    transparent = 0
-    for y in range(SIZE):
-        for x in range(SIZE):
-            if pixels[x, y][3] == 0:
-                transparent += 1
-    opaque = SIZE * SIZE - transparent
+    alpha = arr[..., 3]
+    transparent = int(np.count_nonzero(alpha == 0))
+    opaque = alpha.size - transparent
     print(f"  Transparent pixels: {transparent}")
     print(f"  Non-transparent pixels: {opaque}")
 
@@ -13,7 +13,8 @@ with a gap, and the housing shows more wear. No glow halo since the light is off
 Used to create dark pockets in the otherwise well-lit Level 0.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
+import numpy as np
 import random
 import shutil
 import os
@@ -60,19 +61,34 @@ CRACK_SHARD = (135, 130, 118, 255)     # Glass shard catching ambient light
 SHADOW_FAINT = (30, 28, 25, 15)        # Very subtle dark halo
 
 
+# Offsets of a 3x3 diamond (plus shape) splat
+DIAMOND_OFFSETS = np.array([(0, -1), (-1, 0), (0, 0), (1, 0), (0, 1)])
+
+
 def create_image():
-    """Create a blank 64x64 RGBA image with transparent background."""
-    return Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
+    """Create a blank 64x64 RGBA pixel array with transparent background."""
+    return np.zeros((SIZE, SIZE, 4), dtype=np.uint8)
+
 
+def put_pixels(arr, xy, color, bounds):
+    """Set every (x, y) in xy to color, skipping points outside the inclusive
+    (x_min, y_min, x_max, y_max) bounds."""
+    xs, ys = np.asarray(xy).reshape(-1, 2).T
+    x_min, y_min, x_max, y_max = bounds
+    inside = (x_min <= xs) & (xs <= x_max) & (y_min <= ys) & (ys <= y_max)
+    arr[ys[inside], xs[inside]] = color
 
-def draw_shadow(img):
+
+def draw_shadow(arr):
     """Draw a very subtle dark shadow around the fixture (opposite of glow).
 
     A dead light doesn't illuminate -- it actually creates a darker spot
     on the ceiling from accumulated dust and the fixture blocking ambient light.
-    """
-    pixels = img.load()
 
+    Drawn first, onto the empty canvas: each layer is blended once into a
+    small palette, then every pixel looks up its colour by how many of the
+    nested layers cover it.
+    """
     shadow_layers = [
         # (x_expand, y_expand, color)
         (5, 5, (25, 23, 20, 10)),
@@ -80,30 +96,29 @@ def draw_shadow(img):
         (1, 1, (35, 32, 28, 12)),
     ]
 
-    for x_exp, y_exp, color in shadow_layers:
-        gx1 = FIXTURE_X - x_exp
-        gy1 = FIXTURE_Y - y_exp
-        gx2 = FIXTURE_X + FIXTURE_W + x_exp - 1
-        gy2 = FIXTURE_Y + FIXTURE_H + y_exp - 1
-
-        for y in range(max(0, gy1), min(SIZE, gy2 + 1)):
-            for x in range(max(0, gx1), min(SIZE, gx2 + 1)):
-                # Skip pixels inside the fixture
-                if (FIXTURE_X <= x < FIXTURE_X + FIXTURE_W and
-                        FIXTURE_Y <= y < FIXTURE_Y + FIXTURE_H):
-                    continue
-
-                r0, g0, b0, a0 = pixels[x, y]
-                alpha = color[3] / 255.0
-                r = int(r0 * (1 - alpha) + color[0] * alpha)
-                g = int(g0 * (1 - alpha) + color[1] * alpha)
-                b = int(b0 * (1 - alpha) + color[2] * alpha)
-                a = min(255, a0 + color[3])
-
-                pixels[x, y] = (r, g, b, a)
-
-
-def draw_housing(draw, img):
+    palette = np.zeros((len(shadow_layers) + 1, 4), dtype=np.uint8)
+    depth = np.zeros((SIZE, SIZE), dtype=np.intp)
+    for i, (x_exp, y_exp, color) in enumerate(shadow_layers):
+        # Alpha blend this layer over the previous palette entry, in 8-bit
+        # integer fixed point with rounding
+        alpha = color[3]
+        bg = palette[i, :3].astype(np.uint16)
+        fg = np.array(color[:3], dtype=np.uint16)
+        palette[i + 1, :3] = (bg * (255 - alpha) + fg * alpha + 127) // 255
+        palette[i + 1, 3] = min(255, int(palette[i, 3]) + alpha)
+
+        gx1 = max(0, FIXTURE_X - x_exp)
+        gy1 = max(0, FIXTURE_Y - y_exp)
+        gx2 = min(SIZE - 1, FIXTURE_X + FIXTURE_W + x_exp - 1)
+        gy2 = min(SIZE - 1, FIXTURE_Y + FIXTURE_H + y_exp - 1)
+        depth[gy1:gy2 + 1, gx1:gx2 + 1] += 1
+
+    # Skip pixels inside the fixture
+    depth[FIXTURE_Y:FIXTURE_Y + FIXTURE_H, FIXTURE_X:FIXTURE_X + FIXTURE_W] = 0
+    arr[:] = palette[depth]
+
+
+def draw_housing(arr):
     """Draw the metal housing frame - more battered/worn than working version."""
     x1 = FIXTURE_X
     y1 = FIXTURE_Y
@@ -113,27 +128,24 @@ def draw_housing(draw, img):
     frame_thickness = 3
 
     # Outer frame rectangle - darker base color
-    draw.rectangle([x1, y1, x2, y2], fill=HOUSING_OUTER)
+    arr[y1:y2 + 1, x1:x2 + 1] = HOUSING_OUTER
 
     # Highlight on top and left edges (dimmer than working version)
-    draw.line([(x1, y1), (x2, y1)], fill=HOUSING_INNER, width=1)
-    draw.line([(x1, y1), (x1, y2)], fill=HOUSING_INNER, width=1)
+    arr[y1, x1:x2 + 1] = HOUSING_INNER
+    arr[y1:y2 + 1, x1] = HOUSING_INNER
 
     # Shadow on bottom and right edges
-    draw.line([(x1, y2), (x2, y2)], fill=HOUSING_SHADOW, width=1)
-    draw.line([(x2, y1), (x2, y2)], fill=HOUSING_SHADOW, width=1)
+    arr[y2, x1:x2 + 1] = HOUSING_SHADOW
+    arr[y1:y2 + 1, x2] = HOUSING_SHADOW
 
     # Add some grime/wear marks on the housing
-    pixels = img.load()
     # Scattered darker spots on the metal frame
     grime_positions = [
         (x1 + 5, y1 + 1), (x1 + 12, y1 + 1), (x2 - 8, y1 + 1),
         (x1 + 1, y1 + 2), (x2 - 3, y2 - 1), (x1 + 20, y2 - 1),
         (x2 - 15, y2 - 1), (x1 + 2, y1 + 1),
     ]
-    for gx, gy in grime_positions:
-        if x1 <= gx <= x2 and y1 <= gy <= y2:
-            pixels[gx, gy] = HOUSING_GRIME
+    put_pixels(arr, grime_positions, HOUSING_GRIME, (x1, y1, x2, y2))
 
     # Inner cutout (where the diffuser sits)
     inner_x1 = x1 + frame_thickness
@@ -142,60 +154,45 @@ def draw_housing(draw, img):
     inner_y2 = y2 - frame_thickness
 
     # Inner bevel shadow (recessed look) - same structure as working version
-    draw.line([(inner_x1 - 1, inner_y1 - 1), (inner_x2 + 1, inner_y1 - 1)],
-              fill=HOUSING_SHADOW, width=1)
-    draw.line([(inner_x1 - 1, inner_y1 - 1), (inner_x1 - 1, inner_y2 + 1)],
-              fill=HOUSING_SHADOW, width=1)
+    arr[inner_y1 - 1, inner_x1 - 1:inner_x2 + 2] = HOUSING_SHADOW
+    arr[inner_y1 - 1:inner_y2 + 2, inner_x1 - 1] = HOUSING_SHADOW
 
     return inner_x1, inner_y1, inner_x2, inner_y2
 
 
-def draw_diffuser(draw, img, inner_x1, inner_y1, inner_x2, inner_y2):
+def draw_diffuser(arr, inner_x1, inner_y1, inner_x2, inner_y2):
     """Draw the dirty, yellowed diffuser panel - no longer illuminated."""
     # Fill with dark yellowed plastic
-    draw.rectangle([inner_x1, inner_y1, inner_x2, inner_y2],
-                   fill=DIFFUSER_MID)
+    panel = arr[inner_y1:inner_y2 + 1, inner_x1:inner_x2 + 1]
+    panel[:] = DIFFUSER_MID
 
     # No bright center band -- the light is dead. Instead, subtle uneven tone.
     # Slightly lighter patch in center (ambient light reflection only)
     center_y = (inner_y1 + inner_y2) // 2
-    draw.rectangle([inner_x1 + 4, center_y - 1, inner_x2 - 4, center_y + 1],
-                   fill=DIFFUSER_DARK)
+    arr[center_y - 1:center_y + 2, inner_x1 + 4:inner_x2 - 3] = DIFFUSER_DARK
 
     # Dimmer edges of diffuser
-    draw.line([(inner_x1, inner_y1), (inner_x2, inner_y1)],
-              fill=DIFFUSER_EDGE, width=1)
-    draw.line([(inner_x1, inner_y2), (inner_x2, inner_y2)],
-              fill=DIFFUSER_EDGE, width=1)
-    draw.line([(inner_x1, inner_y1), (inner_x1, inner_y2)],
-              fill=DIFFUSER_EDGE, width=1)
-    draw.line([(inner_x2, inner_y1), (inner_x2, inner_y2)],
-              fill=DIFFUSER_EDGE, width=1)
+    panel[0] = DIFFUSER_EDGE
+    panel[-1] = DIFFUSER_EDGE
+    panel[:, 0] = DIFFUSER_EDGE
+    panel[:, -1] = DIFFUSER_EDGE
 
     # Water stains / discoloration spots on the diffuser
-    pixels = img.load()
-    stain_centers = [
+    stain_centers = np.array([
         (inner_x1 + 8, inner_y1 + 3),
         (inner_x2 - 12, inner_y2 - 3),
         (inner_x1 + 25, inner_y1 + 5),
-    ]
-    for sx, sy in stain_centers:
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                px, py = sx + dx, sy + dy
-                if inner_x1 <= px <= inner_x2 and inner_y1 <= py <= inner_y2:
-                    if abs(dx) + abs(dy) <= 1:  # Diamond shape
-                        pixels[px, py] = DIFFUSER_STAIN
+    ])
+    stain_pixels = stain_centers[:, None, :] + DIAMOND_OFFSETS  # Diamond shape
+    put_pixels(arr, stain_pixels, DIFFUSER_STAIN, (inner_x1, inner_y1, inner_x2, inner_y2))
 
 
-def draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2):
+def draw_tubes(arr, inner_x1, inner_y1, inner_x2, inner_y2):
     """Draw two dead fluorescent tubes.
 
     Top tube: intact but completely dark/dead
     Bottom tube: cracked with a gap/missing section
     """
-    pixels = img.load()
-
     tube_margin_x = 4
     tube_start_x = inner_x1 + tube_margin_x
     tube_end_x = inner_x2 - tube_margin_x
@@ -211,24 +208,24 @@ def draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2):
 
     tube_half_height = 2
 
+    # Columns of the tube and its row offsets
+    xs = np.arange(tube_start_x, tube_end_x + 1)
+    dys = np.arange(-tube_half_height, tube_half_height + 1)
+
+    # Colors of a whole dead tube, built once and shared by both tubes:
+    # outer two rows on each side are edge, only the center row is dead
+    # body, and the corroded end caps cover every row
+    row_colors = np.where((np.abs(dys) >= tube_half_height - 1)[:, None],
+                          np.array(TUBE_DEAD_EDGE, dtype=np.uint8),
+                          np.array(TUBE_DEAD, dtype=np.uint8))
+    cap = (xs < tube_start_x + cap_width) | (xs > tube_end_x - cap_width)
+    dead_tube = np.where(cap[None, :, None], np.array(TUBE_CAP_DARK, dtype=np.uint8),
+                         row_colors[:, None, :])
+
     # --- Top tube: dead but intact ---
-    tube_cy = tube_centers[0]
-    for x in range(tube_start_x, tube_end_x + 1):
-        for dy in range(-tube_half_height, tube_half_height + 1):
-            y = tube_cy + dy
-            if y < inner_y1 or y > inner_y2:
-                continue
-
-            if x < tube_start_x + cap_width or x > tube_end_x - cap_width:
-                color = TUBE_CAP_DARK
-            elif abs(dy) == tube_half_height:
-                color = TUBE_DEAD_EDGE
-            elif abs(dy) == tube_half_height - 1:
-                color = TUBE_DEAD_EDGE
-            else:
-                color = TUBE_DEAD
-
-            pixels[x, y] = color
+    ys = tube_centers[0] + dys
+    on_panel = (ys >= inner_y1) & (ys <= inner_y2)
+    arr[ys[on_panel][:, None], xs] = dead_tube[on_panel]
 
     # --- Bottom tube: cracked with missing section ---
     tube_cy = tube_centers[1]
@@ -236,103 +233,64 @@ def draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2):
     crack_center_x = inner_x1 + (inner_x2 - inner_x1) * 2 // 5
     crack_width = 6  # Width of the broken gap
 
-    for x in range(tube_start_x, tube_end_x + 1):
-        for dy in range(-tube_half_height, tube_half_height + 1):
-            y = tube_cy + dy
-            if y < inner_y1 or y > inner_y2:
-                continue
-
-            # Check if we're in the crack/gap zone
-            dist_from_crack = abs(x - crack_center_x)
-
-            if dist_from_crack < crack_width // 2:
-                # Inside the broken gap - show dark void
-                if abs(dy) <= 1:
-                    # Dark interior visible through the break
-                    pixels[x, y] = CRACK_DARK
-                # Outer edge pixels near crack stay as diffuser (already drawn)
-                continue
-            elif dist_from_crack < crack_width // 2 + 2:
-                # Edge of the break - jagged glass edges
-                if abs(dy) <= tube_half_height - 1:
-                    # Irregular edge: some pixels are shard, some void
-                    if (x + dy) % 3 == 0:
-                        color = CRACK_SHARD
-                    elif (x + dy) % 3 == 1:
-                        color = CRACK_EDGE
-                    else:
-                        color = TUBE_DEAD_EDGE
-                    pixels[x, y] = color
-                continue
-
-            # Normal dead tube section (either side of the crack)
-            if x < tube_start_x + cap_width or x > tube_end_x - cap_width:
-                color = TUBE_CAP_DARK
-            elif abs(dy) == tube_half_height:
-                color = TUBE_DEAD_EDGE
-            elif abs(dy) == tube_half_height - 1:
-                color = TUBE_DEAD_EDGE
-            else:
-                color = TUBE_DEAD
-
-            pixels[x, y] = color
+    dist_from_crack = np.abs(xs - crack_center_x)
+    gap = dist_from_crack < crack_width // 2
+    jagged = ~gap & (dist_from_crack < crack_width // 2 + 2)
+    intact = ~(gap | jagged)
+
+    # Normal dead tube section (either side of the crack)
+    ys = tube_cy + dys
+    on_panel = (ys >= inner_y1) & (ys <= inner_y2)
+    arr[ys[on_panel][:, None], xs[intact]] = dead_tube[on_panel][:, intact]
+
+    # Inside the broken gap - dark interior visible through the break.
+    # Outer edge rows near the crack stay as diffuser (already drawn)
+    core_ys = ys[on_panel & (np.abs(dys) <= tube_half_height - 1)][:, None]
+    arr[core_ys, xs[gap]] = CRACK_DARK
+
+    # Edge of the break - jagged glass edges
+    # Irregular edge: some pixels are shard, some void
+    edge_xs = xs[jagged]
+    jagged_colors = np.array([CRACK_SHARD, CRACK_EDGE, TUBE_DEAD_EDGE], dtype=np.uint8)
+    arr[core_ys, edge_xs] = jagged_colors[(edge_xs + core_ys - tube_cy) % 3]
 
     # Add a couple of tiny glass shard pixels below the crack (fallen debris)
     shard_positions = [
         (crack_center_x - 1, tube_cy + tube_half_height + 1),
         (crack_center_x + 2, tube_cy + tube_half_height + 2),
     ]
-    for sx, sy in shard_positions:
-        if inner_x1 <= sx <= inner_x2 and inner_y1 <= sy <= inner_y2:
-            pixels[sx, sy] = CRACK_SHARD
+    put_pixels(arr, shard_positions, CRACK_SHARD, (inner_x1, inner_y1, inner_x2, inner_y2))
 
 
-def draw_fixture_details(img):
+def draw_fixture_details(arr):
     """Add details: center divider bar, mounting clips - more worn than working."""
-    pixels = img.load()
-
-    cx = SIZE // 2
     cy = SIZE // 2
 
     # Center divider bar (same as working version but darker/worn)
     divider_color = (115, 110, 100, 255)  # Darker than working version
     divider_y = cy
-    for x in range(FIXTURE_X + 5, FIXTURE_X + FIXTURE_W - 5):
-        pixels[x, divider_y] = divider_color
+    arr[divider_y, FIXTURE_X + 5:FIXTURE_X + FIXTURE_W - 5] = divider_color
 
     # A couple of spots where the divider is extra dark (rust/grime)
-    rust_spots = [FIXTURE_X + 15, FIXTURE_X + 30, FIXTURE_X + 40]
-    for rx in rust_spots:
-        if FIXTURE_X + 5 <= rx < FIXTURE_X + FIXTURE_W - 5:
-            pixels[rx, divider_y] = HOUSING_GRIME
+    rust_spots = [(FIXTURE_X + 15, divider_y), (FIXTURE_X + 30, divider_y), (FIXTURE_X + 40, divider_y)]
+    put_pixels(arr, rust_spots, HOUSING_GRIME,
+               (FIXTURE_X + 5, divider_y, FIXTURE_X + FIXTURE_W - 6, divider_y))
 
     # Mounting detail marks (same positions as working version)
     mount_color = HOUSING_SHADOW
     # Left mount
-    for dy in range(-1, 2):
-        for dx in range(0, 2):
-            y = cy + dy
-            x = FIXTURE_X + 1 + dx
-            if 0 <= x < SIZE and 0 <= y < SIZE:
-                pixels[x, y] = mount_color
+    arr[cy - 1:cy + 2, FIXTURE_X + 1:FIXTURE_X + 3] = mount_color
     # Right mount
-    for dy in range(-1, 2):
-        for dx in range(0, 2):
-            y = cy + dy
-            x = FIXTURE_X + FIXTURE_W - 2 - dx
-            if 0 <= x < SIZE and 0 <= y < SIZE:
-                pixels[x, y] = mount_color
+    arr[cy - 1:cy + 2, FIXTURE_X + FIXTURE_W - 3:FIXTURE_X + FIXTURE_W - 1] = mount_color
 
     # Extra wear: a scratch mark across the housing (diagonal line on frame)
     scratch_color = (95, 90, 80, 255)
     scratch_start_x = FIXTURE_X + 35
     scratch_start_y = FIXTURE_Y + 1
-    for i in range(4):
-        sx = scratch_start_x + i
-        sy = scratch_start_y + (i // 2)
-        if (FIXTURE_X <= sx < FIXTURE_X + FIXTURE_W and
-                FIXTURE_Y <= sy < FIXTURE_Y + 3):
-            pixels[sx, sy] = scratch_color
+    i = np.arange(4)
+    scratch = np.stack([scratch_start_x + i, scratch_start_y + i // 2], axis=1)
+    put_pixels(arr, scratch, scratch_color,
+               (FIXTURE_X, FIXTURE_Y, FIXTURE_X + FIXTURE_W - 1, FIXTURE_Y + 2))
 
 
 def generate_broken_fluorescent_light():
@@ -340,30 +298,30 @@ def generate_broken_fluorescent_light():
     print("Generating BROKEN fluorescent ceiling light sprite (64x64 RGBA)...")
 
     # Step 1: Create blank image
-    img = create_image()
+    arr = create_image()
 
     # Step 2: Draw subtle dark shadow (instead of glow)
     print("  - Drawing ambient shadow...")
-    draw_shadow(img)
+    draw_shadow(arr)
 
     # Step 3: Draw worn metal housing frame
     print("  - Drawing worn metal housing frame...")
-    draw = ImageDraw.Draw(img)
-    inner_x1, inner_y1, inner_x2, inner_y2 = draw_housing(draw, img)
+    inner_x1, inner_y1, inner_x2, inner_y2 = draw_housing(arr)
 
     # Step 4: Draw dirty diffuser panel
     print("  - Drawing dirty diffuser panel...")
-    draw_diffuser(draw, img, inner_x1, inner_y1, inner_x2, inner_y2)
+    draw_diffuser(arr, inner_x1, inner_y1, inner_x2, inner_y2)
 
     # Step 5: Draw dead/cracked tubes
     print("  - Drawing dead and cracked tubes...")
-    draw_tubes(img, inner_x1, inner_y1, inner_x2, inner_y2)
+    draw_tubes(arr, inner_x1, inner_y1, inner_x2, inner_y2)
 
     # Step 6: Add worn fixture details
     print("  - Adding fixture details and wear marks...")
-    draw_fixture_details(img)
+    draw_fixture_details(arr)
 
     # Save output
+    img = Image.fromarray(arr, "RGBA")
     img.save(OUTPUT_PATH)
     print(f"  Saved to {OUTPUT_PATH}")
 
@@ -378,13 +336,9 @@ def generate_broken_fluorescent_light():
     print(f"  Mode: {img.mode}")
 
     # Count transparent vs opaque pixels
-    pixels = img.load()
-    transparent = 0
-    for y in range(SIZE):
-        for x in range(SIZE):
-            if pixels[x, y][3] == 0:
-                transparent += 1
-    opaque = SIZE * SIZE - transparent
+    alpha = arr[..., 3]
+    transparent = int(np.count_nonzero(alpha == 0))
+    opaque = alpha.size - transparent
     print(f"  Transparent pixels: {transparent}")
     print(f"  Non-transparent pixels: {opaque}")
 
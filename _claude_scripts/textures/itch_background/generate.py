@@ -6,8 +6,9 @@ Based on the Backrooms Level 0 wallpaper texture, but heavily darkened
 and desaturated to create a subtle, non-distracting background pattern.
 """
 
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 import numpy as np
+from scipy.ndimage import gaussian_filter
 
 # Paths
 SOURCE_TEXTURE = "/home/drew/projects/deep_yellow/assets/levels/level_00/textures/wallpaper_yellow.png"
@@ -19,6 +20,10 @@ BRIGHTNESS_FACTOR = 0.25  # Darken to 25% of original
 SATURATION_FACTOR = 0.15  # Desaturate to 15% (nearly grayscale)
 NOISE_INTENSITY = 8  # Subtle grain intensity
 BLUR_AMOUNT = 0.5  # Tiny bit of blur to soften the pattern
+SEED = 42  # Grain seed, for reproducible output
+
+# ITU-R 601-2 luma weights, as used by PIL's "L" conversion
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
 
 
 def tile_image(img: Image.Image, target_size: int) -> Image.Image:
@@ -36,37 +41,45 @@ def tile_image(img: Image.Image, target_size: int) -> Image.Image:
     tiles_x = (target_size + src_w - 1) // src_w  # Ceiling division
     tiles_y = (target_size + src_h - 1) // src_h
 
-    # Create tiled image
-    tiled = Image.new('RGB', (tiles_x * src_w, tiles_y * src_h))
-    for y in range(tiles_y):
-        for x in range(tiles_x):
-            tiled.paste(img, (x * src_w, y * src_h))
-
-    # Crop to exact target size
-    return tiled.crop((0, 0, target_size, target_size))
+    # Tile in one go and crop to exact target size
+    arr = np.asarray(img.convert('RGB'))
+    tiled = np.tile(arr, (tiles_y, tiles_x, 1))[:target_size, :target_size]
+    return Image.fromarray(tiled)
 
 
-def add_grain(img: Image.Image, intensity: int) -> Image.Image:
+def grade(img: Image.Image, saturation: float, brightness: float) -> np.ndarray:
     """
-    Add subtle film grain / noise to the image.
+    Desaturate and darken the image in a single pass.
+
+    Equivalent to ImageEnhance.Color followed by ImageEnhance.Brightness,
+    without rounding to 8 bits in between.
 
     Args:
-        img: Input image
-        intensity: Noise intensity (0-255 range)
+        img: Input RGB image
+        saturation: Color factor (0 = grayscale, 1 = unchanged)
+        brightness: Brightness factor (0 = black, 1 = unchanged)
 
     Returns:
-        Image with grain added
+        float32 array of the graded image (unclamped)
     """
-    img_array = np.array(img, dtype=np.float32)
+    arr = np.asarray(img, dtype=np.float32)
+    gray = (arr @ LUMA_WEIGHTS)[..., None]
+    return (gray * (1 - saturation) + arr * saturation) * brightness
 
-    # Generate noise
-    noise = np.random.normal(0, intensity, img_array.shape)
 
-    # Add noise and clamp
-    noisy = img_array + noise
-    noisy = np.clip(noisy, 0, 255).astype(np.uint8)
+def add_grain(img_array: np.ndarray, intensity: int, rng: np.random.Generator) -> None:
+    """
+    Add subtle film grain / noise to the image, in place.
 
-    return Image.fromarray(noisy)
+    Args:
+        img_array: float32 image array
+        intensity: Noise intensity (0-255 range)
+        rng: Random generator for the grain
+    """
+    noise = np.empty_like(img_array)
+    rng.standard_normal(dtype=np.float32, out=noise)
+    noise *= intensity
+    img_array += noise
 
 
 def main():
@@ -82,28 +95,27 @@ def main():
     else:
         img = source
 
-    # Heavily desaturate (nearly grayscale with hint of color)
-    print(f"Desaturating to {SATURATION_FACTOR*100:.0f}%...")
-    enhancer = ImageEnhance.Color(img)
-    img = enhancer.enhance(SATURATION_FACTOR)
+    # Heavily desaturate (nearly grayscale with hint of color) and darken
+    print(f"Desaturating to {SATURATION_FACTOR*100:.0f}% "
+          f"and darkening to {BRIGHTNESS_FACTOR*100:.0f}%...")
+    img_array = grade(img, SATURATION_FACTOR, BRIGHTNESS_FACTOR)
 
-    # Heavily darken
-    print(f"Darkening to {BRIGHTNESS_FACTOR*100:.0f}%...")
-    enhancer = ImageEnhance.Brightness(img)
-    img = enhancer.enhance(BRIGHTNESS_FACTOR)
-
-    # Slight blur to soften the pattern
+    # Slight blur to soften the pattern (wrapping, so it stays tileable)
     if BLUR_AMOUNT > 0:
         print(f"Applying subtle blur (radius={BLUR_AMOUNT})...")
-        img = img.filter(ImageFilter.GaussianBlur(radius=BLUR_AMOUNT))
+        img_array = gaussian_filter(img_array, sigma=(BLUR_AMOUNT, BLUR_AMOUNT, 0), mode='wrap')
 
     # Add subtle grain for texture
     print(f"Adding grain (intensity={NOISE_INTENSITY})...")
-    img = add_grain(img, NOISE_INTENSITY)
+    add_grain(img_array, NOISE_INTENSITY, np.random.default_rng(SEED))
+
+    # Clamp and quantize once, at the end
+    np.clip(img_array, 0, 255, out=img_array)
+    img = Image.fromarray(img_array.astype(np.uint8))
 
     # Save output
     print(f"Saving to: {OUTPUT_PATH}")
-    img.save(OUTPUT_PATH, 'PNG', optimize=True)
+    img.save(OUTPUT_PATH, 'PNG', compress_level=6)
 
     # Report final stats
     img_array = np.array(img)
@@ -4,7 +4,9 @@ Generate itch.io banner for DEEP YELLOW
 Output: 960x300 panoramic banner with game title and sprites
 """
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
+from functools import lru_cache
+import os
+from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import numpy as np
 from pathlib import Path
 
@@ -12,6 +14,9 @@ from pathlib import Path
 WIDTH = 960
 HEIGHT = 300
 OUTPUT_PATH = Path(__file__).parent / "output.png"
+SEED = 42  # Noise seed, for reproducible output
+# Fast PNG encode while iterating; set RELEASE=1 for the smallest file
+PNG_COMPRESS_LEVEL = 9 if os.environ.get("RELEASE") else 1
 
 # Asset paths (relative to project root)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
@@ -22,8 +27,30 @@ BACTERIA_PATH = PROJECT_ROOT / "assets/textures/entities/bacteria_spreader.png"
 ITEMS_DIR = PROJECT_ROOT / "assets/textures/items"
 
 
+# Wallpaper grading: darken and desaturate slightly for contrast
+WALLPAPER_BRIGHTNESS = 0.7
+WALLPAPER_SATURATION = 0.6
+# ITU-R 601-2 luma weights, as used by PIL's "L" conversion
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+# Wallpaper shade (brightness times a darker-edges vignette), precomputed
+# once for the fixed banner size
+def _make_wallpaper_shade():
+    y_coords, x_coords = np.ogrid[:HEIGHT, :WIDTH]
+    # Distance from center, normalized
+    max_dist = np.hypot(WIDTH / 2, HEIGHT / 2)
+    dist = np.hypot(x_coords - WIDTH / 2, y_coords - HEIGHT / 2)
+    vignette = 1.0 - (dist / max_dist) * 0.5  # Darken edges by 50%
+    return (WALLPAPER_BRIGHTNESS * vignette).astype(np.float32)[:, :, np.newaxis]
+
+
+WALLPAPER_SHADE = _make_wallpaper_shade()
+
+
+@lru_cache(maxsize=64)
 def load_image(path, scale=1.0):
-    """Load image and optionally scale it"""
+    """Load image and optionally scale it (cached; callers must not modify it)"""
     img = Image.open(path).convert("RGBA")
     if scale != 1.0:
         new_size = (int(img.width * scale), int(img.height * scale))
@@ -32,71 +59,43 @@ def load_image(path, scale=1.0):
 
 
 def tile_wallpaper():
-    """Create tiled wallpaper background"""
-    wallpaper = load_image(WALLPAPER_PATH)
+    """Create tiled wallpaper background, as an RGB pixel array"""
+    # The wallpaper is opaque, so tile it straight in RGB for processing
+    wallpaper = np.asarray(Image.open(WALLPAPER_PATH).convert("RGB"))
 
-    # Create base canvas
-    bg = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 255))
+    # Tile wallpaper, cropping the partial tiles at the right/bottom edges
+    tile_h, tile_w = wallpaper.shape[:2]
+    tiles_x = -(-WIDTH // tile_w)
+    tiles_y = -(-HEIGHT // tile_h)
+    bg = np.tile(wallpaper, (tiles_y, tiles_x, 1))[:HEIGHT, :WIDTH].astype(np.float32)
 
-    # Tile wallpaper
-    tile_w, tile_h = wallpaper.size
-    for y in range(0, HEIGHT, tile_h):
-        for x in range(0, WIDTH, tile_w):
-            bg.paste(wallpaper, (x, y), wallpaper)
+    # Desaturate, darken and vignette in one pass
+    gray = (bg @ LUMA_WEIGHTS)[:, :, np.newaxis]
+    bg = (gray * (1 - WALLPAPER_SATURATION) + bg * WALLPAPER_SATURATION) * WALLPAPER_SHADE
+    np.clip(bg, 0, 255, out=bg)
 
-    # Convert to RGB for processing
-    bg = bg.convert("RGB")
+    return bg.astype(np.uint8)
 
-    # Darken and desaturate slightly for contrast
-    enhancer = ImageEnhance.Brightness(bg)
-    bg = enhancer.enhance(0.7)
 
-    enhancer = ImageEnhance.Color(bg)
-    bg = enhancer.enhance(0.6)
+def add_scanlines(arr):
+    """Add PSX-style scanlines, in place"""
+    # Every other row, darken slightly (x 217/256 ~= 0.85, in integer math)
+    arr[::2] = (arr[::2].astype(np.uint16) * 217 >> 8).astype(np.uint8)
 
-    # Add vignette (darker edges)
-    arr = np.array(bg, dtype=np.float32)
-
-    # Create radial gradient for vignette
-    y_coords, x_coords = np.ogrid[:HEIGHT, :WIDTH]
-    center_y, center_x = HEIGHT / 2, WIDTH / 2
-
-    # Distance from center, normalized
-    max_dist = np.sqrt((WIDTH/2)**2 + (HEIGHT/2)**2)
-    dist = np.sqrt((x_coords - center_x)**2 + (y_coords - center_y)**2)
-    vignette = 1.0 - (dist / max_dist) * 0.5  # Darken edges by 50%
 
-    # Apply vignette
-    vignette = vignette[:, :, np.newaxis]  # Add channel dimension
-    arr = arr * vignette
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
+def add_noise(arr, rng, intensity=0.03):
+    """Add PSX-style noise, in place"""
+    noisy = arr.astype(np.float32)
 
-    return Image.fromarray(arr).convert("RGBA")
-
-
-def add_scanlines(img):
-    """Add PSX-style scanlines"""
-    arr = np.array(img)
-
-    # Every other row, darken slightly
-    for y in range(0, HEIGHT, 2):
-        arr[y] = (arr[y] * 0.85).astype(np.uint8)
-
-    return Image.fromarray(arr)
-
-
-def add_noise(img, intensity=0.03):
-    """Add PSX-style noise"""
-    arr = np.array(img, dtype=np.float32)
-
-    # Generate noise
-    noise = np.random.normal(0, intensity * 255, arr.shape)
+    # Generate noise straight into a float32 scratch buffer
+    noise = np.empty_like(noisy)
+    rng.standard_normal(dtype=np.float32, out=noise)
+    noise *= intensity * 255
 
     # Add noise
-    arr = arr + noise
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-
-    return Image.fromarray(arr)
+    noisy += noise
+    np.clip(noisy, 0, 255, out=noisy)
+    arr[:] = noisy
 
 
 def draw_text_with_outline(draw, text, position, font_size=60, outline_width=4):
@@ -116,49 +115,54 @@ def draw_text_with_outline(draw, text, position, font_size=60, outline_width=4):
     # Adjust x position to center the text
     x = x - text_width // 2
 
-    # Draw black outline (offset in all directions)
-    for offset_x in range(-outline_width, outline_width + 1):
-        for offset_y in range(-outline_width, outline_width + 1):
-            if offset_x != 0 or offset_y != 0:
-                draw.text((x + offset_x, y + offset_y), text, font=font, fill=(0, 0, 0, 255))
+    # Draw black outline: rasterize the text once into a mask and dilate it
+    # with a square max filter, which covers every offset in all directions
+    left, top, right, bottom = draw.textbbox((x, y), text, font=font)
+    pad = outline_width
+    mask = Image.new("L", (right - left + 2 * pad, bottom - top + 2 * pad), 0)
+    ImageDraw.Draw(mask).text((x - left + pad, y - top + pad), text, font=font, fill=255)
+    outline = mask.filter(ImageFilter.MaxFilter(2 * outline_width + 1))
+    draw.bitmap((left - pad, top - pad), outline, fill=(0, 0, 0))
 
     # Draw deep yellow main text
-    draw.text((x, y), text, font=font, fill=(255, 210, 50, 255))
+    draw.text((x, y), text, font=font, fill=(255, 210, 50))
 
     return font
 
 
-def add_chromatic_aberration(img, offset=2):
-    """Add RGB split effect to the image"""
-    arr = np.array(img)
-
-    # Split channels
-    r = arr[:, :, 0]
-    g = arr[:, :, 1]
-    b = arr[:, :, 2]
-    a = arr[:, :, 3] if arr.shape[2] == 4 else None
-
-    # Shift red left, blue right
-    r_shifted = np.roll(r, -offset, axis=1)
-    b_shifted = np.roll(b, offset, axis=1)
+def add_chromatic_aberration(arr, offset=2):
+    """Add RGB split effect to the image, in place"""
+    if offset <= 0:
+        return
 
-    # Recombine
-    result = np.stack([r_shifted, g, b_shifted], axis=2)
-    if a is not None:
-        result = np.concatenate([result, a[:, :, np.newaxis]], axis=2)
-
-    return Image.fromarray(result.astype(np.uint8))
+    # Shift red left, blue right, in place; the columns uncovered at the
+    # banner edges repeat the last shifted-in column
+    arr[:, :-offset, 0] = arr[:, offset:, 0]
+    arr[:, -offset:, 0] = arr[:, -offset - 1:-offset, 0]
+    arr[:, offset:, 2] = arr[:, :-offset, 2]
+    arr[:, :offset, 2] = arr[:, offset:offset + 1, 2]
 
 
 def composite_sprite(canvas, sprite_path, position, scale=1.0, flip=False):
-    """Paste sprite onto canvas at position"""
-    sprite = load_image(sprite_path, scale)
+    """Alpha-blend sprite onto the canvas pixel array at position"""
+    sprite = np.asarray(load_image(sprite_path, scale), dtype=np.float32)
 
     if flip:
-        sprite = sprite.transpose(Image.FLIP_LEFT_RIGHT)
+        sprite = sprite[:, ::-1]
+
+    # Clip the sprite to the canvas
+    x, y = position
+    h, w = sprite.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, canvas.shape[1]), min(y + h, canvas.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    sprite = sprite[y0 - y:y1 - y, x0 - x:x1 - x]
 
-    # Paste with alpha
-    canvas.paste(sprite, position, sprite)
+    # Blend the opaque RGB canvas towards the sprite by the sprite's alpha
+    region = canvas[y0:y1, x0:x1]
+    alpha = sprite[:, :, 3:] / 255
+    region[:] = np.rint(region + (sprite[:, :, :3] - region) * alpha)
 
 
 def generate_banner():
@@ -167,7 +171,7 @@ def generate_banner():
 
     # Create tiled wallpaper background
     print("  → Tiling wallpaper background...")
-    canvas = tile_wallpaper()
+    canvas = Image.fromarray(tile_wallpaper())
 
     # Add title text in upper portion
     print("  → Adding title text...")
@@ -183,8 +187,10 @@ def generate_banner():
         outline_width=5
     )
 
-    # Add sprites scattered across the width
+    # Add sprites scattered across the width. From here on the canvas is
+    # an RGB pixel array; it only goes back to PIL (as RGBA) for saving
     print("  → Adding sprites...")
+    canvas = np.array(canvas)
 
     # Shift offset for all collage sprites (up and to the left)
     SHIFT_X = -40
@@ -251,13 +257,13 @@ def generate_banner():
 
     # Add PSX effects
     print("  → Applying PSX effects...")
-    canvas = add_scanlines(canvas)
-    canvas = add_noise(canvas, intensity=0.02)
-    canvas = add_chromatic_aberration(canvas, offset=2)
+    add_scanlines(canvas)
+    add_noise(canvas, np.random.default_rng(SEED), intensity=0.02)
+    add_chromatic_aberration(canvas, offset=2)
 
     # Save output
     print(f"  → Saving to {OUTPUT_PATH}...")
-    canvas.save(OUTPUT_PATH)
+    Image.fromarray(canvas, "RGB").convert("RGBA").save(OUTPUT_PATH, compress_level=PNG_COMPRESS_LEVEL)
 
     # Verify dimensions
     saved = Image.open(OUTPUT_PATH)